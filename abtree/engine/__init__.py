@@ -8,11 +8,12 @@ blackboard system, event dispatcher, and tick manager.
 from .behavior_tree import BehaviorTree
 from .blackboard import Blackboard
 from .event import EventDispatcher
-from .tick_manager import TickManager
+from .tick_manager import TickManager, TickScheduler
 
 __all__ = [
     "BehaviorTree",
     "Blackboard", 
     "EventDispatcher",
     "TickManager",
+    "TickScheduler",
 ] 
\ No newline at end of file
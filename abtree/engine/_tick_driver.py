@@ -0,0 +1,111 @@
+"""
+Tick Driver - Thread-based periodic wake-ups for the Tick Manager
+
+The asyncio selector only sleeps with millisecond granularity, which caps the
+pacing accuracy of high tick rates. The driver keeps the periodic timer on a
+dedicated thread that sleeps against absolute monotonic deadlines and hands
+each wake-up to the event loop with loop.call_soon_threadsafe.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class ThreadedTickDriver:
+    """
+    Threaded Tick Driver
+
+    Produces one wake-up per interval on a daemon thread. Wake-ups that arrive
+    while the previous tick is still running are coalesced into one, so a slow
+    tick never builds up a backlog.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float) -> None:
+        """
+        Initialize the driver
+
+        Args:
+            loop: Event loop that receives the wake-ups
+            interval: Time between wake-ups in seconds
+        """
+        self._loop = loop
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._waiter: Optional["asyncio.Future[None]"] = None
+        self._pending = False
+
+    def start(self) -> None:
+        """Start the timer thread"""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="abtree-tick-driver", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the timer thread and release any pending waiter"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.cancel()
+
+    def set_interval(self, interval: float) -> None:
+        """
+        Change the wake-up interval, effective from the next deadline
+
+        Args:
+            interval: Time between wake-ups in seconds
+        """
+        self._interval = interval
+
+    async def wait(self) -> None:
+        """Wait for the next wake-up, returning at once if one is pending"""
+        if self._pending:
+            self._pending = False
+            return
+        waiter = self._loop.create_future()
+        self._waiter = waiter
+        try:
+            await waiter
+        finally:
+            self._waiter = None
+        self._pending = False
+
+    def _signal(self) -> None:
+        """Deliver a wake-up on the event loop thread"""
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+        else:
+            self._pending = True
+
+    def _run(self) -> None:
+        """Timer thread body"""
+        monotonic = time.monotonic
+        stopped = self._stopped
+        deadline = monotonic()
+
+        while not stopped.is_set():
+            interval = self._interval
+            deadline += interval
+            delay = deadline - monotonic()
+            if delay > 0:
+                if stopped.wait(delay):
+                    break
+            elif delay < -interval:
+                # Fell more than a tick behind: resynchronize instead of
+                # bursting to catch up
+                deadline = monotonic()
+
+            try:
+                self._loop.call_soon_threadsafe(self._signal)
+            except RuntimeError:
+                # Event loop was closed under us
+                break
@@ -7,7 +7,7 @@ Focused on triggering mechanism between behavior trees without data transfer.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass
 
 
@@ -58,41 +58,72 @@ class EventDispatcher:
             data: Event data (optional)
         """
         async with self._lock:
-            # Create event if it doesn't exist
-            if event_name not in self._events:
-                self._events[event_name] = asyncio.Event()
-                self._event_info[event_name] = EventInfo(
-                    name=event_name,
-                    source=source,
-                    timestamp=self._loop.time(),
-                    trigger_count=0,
-                    data=data
-                )
-            
-            # Update event info
-            event_info = self._event_info[event_name]
-            event_info.source = source
-            event_info.timestamp = self._loop.time()
-            event_info.trigger_count += 1
-            event_info.data = data
-            
-            # Set the event to trigger all listeners
-            self._events[event_name].set()
-            
-            # Also trigger global listeners
+            self._trigger(event_name, source, data)
+    
+    async def emit_many(self, events: Iterable[Tuple[str, Optional[Any]]], source: Optional[str] = None) -> None:
+        """
+        Emit several events under one lock acquisition
+        
+        Args:
+            events: (event_name, data) pairs, emitted in order
+            source: Event source shared by all events (optional)
+        """
+        async with self._lock:
+            for event_name, data in events:
+                self._trigger(event_name, source, data)
+    
+    def emit_nowait(self, event_name: str, source: Optional[str] = None, data: Optional[Any] = None) -> None:
+        """
+        Emit an event from synchronous code
+        
+        The lock is never held across an await, so triggering directly is
+        equivalent to emit() and needs neither a task nor a running loop.
+        
+        Args:
+            event_name: Event name to emit
+            source: Event source (optional)
+            data: Event data (optional)
+        """
+        self._trigger(event_name, source, data)
+    
+    def _trigger(self, event_name: str, source: Optional[str], data: Optional[Any]) -> None:
+        """Record and set one event; the caller holds the lock"""
+        # Create event if it doesn't exist
+        if event_name not in self._events:
+            self._events[event_name] = asyncio.Event()
+            self._event_info[event_name] = EventInfo(
+                name=event_name,
+                source=source,
+                timestamp=self._loop.time(),
+                trigger_count=0,
+                data=data
+            )
+        
+        # Update event info
+        event_info = self._event_info[event_name]
+        event_info.source = source
+        event_info.timestamp = self._loop.time()
+        event_info.trigger_count += 1
+        event_info.data = data
+        
+        # Set the event to trigger all listeners
+        self._events[event_name].set()
+        
+        # Also trigger global listeners (skipped when none are registered)
+        if self._global_listeners:
             for global_event in self._global_listeners:
                 global_event.set()
-            
-            # Trigger middleware publish if this is a topic event
-            if event_name.startswith("topic_"):
-                topic = event_name[6:]  # Remove "topic_" prefix
-                # Try to find middleware through blackboard
-                try:
-                    # This is a bit of a hack, but we need to access the middleware
-                    # We'll let the forest handle this through its own mechanism
-                    pass
-                except Exception:
-                    pass
+        
+        # Trigger middleware publish if this is a topic event
+        if event_name.startswith("topic_"):
+            topic = event_name[6:]  # Remove "topic_" prefix
+            # Try to find middleware through blackboard
+            try:
+                # This is a bit of a hack, but we need to access the middleware
+                # We'll let the forest handle this through its own mechanism
+                pass
+            except Exception:
+                pass
 
     async def wait_for(self, event_name: str, timeout: Optional[float] = None) -> bool:
         """
@@ -214,10 +245,12 @@ class EventDispatcher:
         Returns:
             True if the event was found and removed
         """
-        if global_event in self._global_listeners:
-            self._global_listeners.remove(global_event)
-            return True
-        return False
+        listeners = self._global_listeners
+        remaining = [listener for listener in listeners if listener is not global_event]
+        if len(remaining) == len(listeners):
+            return False
+        self._global_listeners = remaining
+        return True
 
     def clear_event(self, event_name: str) -> bool:
         """
@@ -6,16 +6,74 @@ providing both automatic execution and manual control modes.
 """
 
 import asyncio
+import heapq
+import logging
+import sys
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from ..core.status import Status
 from ..nodes.base import BaseNode
+from ._tick_driver import ThreadedTickDriver
 from .blackboard import Blackboard
 
+# Granularity of the clock behind the event loop; added to sleeps so that a
+# wake-up never lands just before its deadline
+_CLOCK_RESOLUTION = time.get_clock_info("monotonic").resolution
 
-@dataclass
+_logger = logging.getLogger(__name__)
+
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Weight of the newest sample in the oversleep moving average used by _run
+_SLEEP_BIAS_SMOOTHING = 0.1
+
+# In high precision mode, tick intervals below the threshold sleep until the
+# spin window before the deadline and then yield to the loop until it passes
+_SPIN_INTERVAL_THRESHOLD = 0.002
+_SPIN_WINDOW = 0.0015
+
+
+def _release_waiter(waiter: "asyncio.Future[None]") -> None:
+    """Resolve a sleep waiter unless it was cancelled in the meantime"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+async def _sleep_until(loop: asyncio.AbstractEventLoop, when: float) -> None:
+    """
+    Sleep until an absolute time on the event loop clock
+
+    Schedules the wake-up directly with loop.call_at, avoiding the extra
+    clock read and wrapper coroutine of asyncio.sleep.
+
+    Args:
+        loop: Running event loop
+        when: Absolute wake-up time in loop.time() units
+    """
+    waiter = loop.create_future()
+    handle = loop.call_at(when, _release_waiter, waiter)
+    try:
+        await waiter
+    finally:
+        handle.cancel()
+
+
+def _noop_tick(status: Status) -> None:
+    """Placeholder used when no tick callback is set"""
+
+
+def _noop_status_change(old_status: Status, new_status: Status) -> None:
+    """Placeholder used when no status change callback is set"""
+
+
+# Fields whose assignment rebinds the tick hot path
+_CALLBACK_FIELDS = frozenset({"on_tick", "on_status_change"})
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TickManager:
     """
     Tick Manager
@@ -28,11 +86,18 @@ class TickManager:
         running: Whether the manager is running
         root_node: Root node
         blackboard: Blackboard system
-        on_tick: Tick callback function
-        on_status_change: Status change callback function
+        on_tick: Tick callback function; assigning it rebinds the tick path
+        on_status_change: Status change callback function; assigning it
+            rebinds the tick path
+        scheduler: Shared TickScheduler driving this manager instead of its own task
+        timer_thread: Pace ticks from a dedicated timer thread for finer
+            granularity than the event loop's millisecond timers
+        high_precision: Spin on the event loop for the last part of each wait
+            when the tick interval is below 2ms, trading CPU for accuracy
         _task: Asynchronous task
-        _last_tick_time: Last execution time
+        _last_tick_time: Last execution time (monotonic clock)
         _tick_count: Execution count statistics
+        _error_count: Number of ticks that raised while running periodically
     """
 
     tick_rate: float = 60.0  # Default 60 FPS
@@ -41,15 +106,62 @@ class TickManager:
     blackboard: Optional[Blackboard] = None
     on_tick: Optional[Callable[[Status], None]] = None
     on_status_change: Optional[Callable[[Status, Status], None]] = None
+    scheduler: Optional["TickScheduler"] = None
+    timer_thread: bool = False
+    high_precision: bool = False
     _task: Optional[asyncio.Task] = None
     _last_tick_time: float = field(default=0.0, init=False)
     _tick_count: int = field(default=0, init=False)
     _last_status: Status = field(default=Status.FAILURE, init=False)
+    _config_version: int = field(default=0, init=False)
+    _error_count: int = field(default=0, init=False)
+    _on_tick: Callable[[Status], None] = field(
+        default=_noop_tick, init=False, repr=False, compare=False
+    )
+    _on_status_change: Callable[[Status, Status], None] = field(
+        default=_noop_status_change, init=False, repr=False, compare=False
+    )
+    _tick: Callable[[], Awaitable[Status]] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialize the blackboard after initialization"""
         if self.blackboard is None:
             self.blackboard = Blackboard()
+        self._bind_callbacks()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set an attribute, rebinding the tick path when a callback changes
+
+        Assigning on_tick or on_status_change after construction behaves like
+        the set_*_callback methods. During __init__ the tick path is not bound
+        yet, so __post_init__ binds it once every field is set.
+        """
+        object.__setattr__(self, name, value)
+        if name in _CALLBACK_FIELDS and hasattr(self, "_tick"):
+            self._bind_callbacks()
+
+    def _bind_callbacks(self) -> None:
+        """
+        Bind the callbacks used on the tick hot path
+
+        Missing callbacks are replaced by no-ops so tick_once can call them
+        unconditionally. The periodic loops only run after start() has
+        validated the root node and blackboard, so they use variants that
+        skip those checks, and _tick_once_quiet also skips the callbacks when
+        neither is set.
+        """
+        self._on_tick = self.on_tick or _noop_tick
+        self._on_status_change = self.on_status_change or _noop_status_change
+
+        # Only specialize when tick_once has not been overridden by a subclass
+        if type(self).tick_once is not TickManager.tick_once:
+            self._tick = self.tick_once
+        elif self.on_tick is None and self.on_status_change is None:
+            self._tick = self._tick_once_quiet
+        else:
+            self._tick = self._tick_once_validated
+        self._config_version += 1
 
     async def start(self, root_node: Optional[BaseNode] = None) -> None:
         """
@@ -64,19 +176,26 @@ class TickManager:
         if self.root_node is None:
             raise ValueError("Root node must be specified")
 
+        if self.blackboard is None:
+            raise ValueError("Blackboard system is not set")
+
         if self.running:
             return
 
         self.running = True
-        self._last_tick_time = time.time()
+        self._last_tick_time = time.monotonic()
         self._tick_count = 0
+        self._error_count = 0
         self._last_status = Status.FAILURE
 
         # Reset root node status
         self.root_node.reset()
 
-        # Create asynchronous task
-        self._task = asyncio.create_task(self._run())
+        # Let a shared scheduler drive the ticks, or create our own task
+        if self.scheduler is not None:
+            self.scheduler.register(self)
+        else:
+            self._task = asyncio.create_task(self._run())
 
     async def stop(self) -> None:
         """Stop the Tick Manager"""
@@ -84,6 +203,10 @@ class TickManager:
             return
 
         self.running = False
+        self._config_version += 1
+
+        if self.scheduler is not None:
+            self.scheduler.unregister(self)
 
         if self._task is not None:
             self._task.cancel()
@@ -111,44 +234,183 @@ class TickManager:
 
         # Update statistics
         self._tick_count += 1
-        self._last_tick_time = time.time()
+        self._last_tick_time = time.monotonic()
 
-        # Check status change
-        if status != self._last_status:
-            if self.on_status_change:
-                self.on_status_change(self._last_status, status)
+        # Check status change; Status members are singletons, so identity
+        # avoids both IntEnum comparison and the slow Enum.value descriptor
+        last_status = self._last_status
+        if status is not last_status:
+            self._on_status_change(last_status, status)
             self._last_status = status
 
         # Call Tick callback
-        if self.on_tick:
-            self.on_tick(status)
+        self._on_tick(status)
+
+        return status
+
+    async def _tick_once_validated(self) -> Status:
+        """
+        Execute one Tick without re-validating the root node and blackboard
+
+        Used by the periodic loops, which only run after start() has
+        validated both. The loops record _last_tick_time themselves from the
+        clock reading they already take for pacing.
+
+        Returns:
+            Execution result status
+        """
+        status = await self.root_node.tick()  # type: ignore[union-attr]
+
+        self._tick_count += 1
+
+        last_status = self._last_status
+        if status is not last_status:
+            self._on_status_change(last_status, status)
+            self._last_status = status
+
+        self._on_tick(status)
+
+        return status
+
+    async def _tick_once_quiet(self) -> Status:
+        """
+        Execute one Tick without validation or callbacks
+
+        Used by the periodic loops while neither on_tick nor on_status_change
+        is set.
+
+        Returns:
+            Execution result status
+        """
+        status = await self.root_node.tick()  # type: ignore[union-attr]
+
+        self._tick_count += 1
+        self._last_status = status
 
         return status
 
     async def _run(self) -> None:
-        """Internal running loop"""
-        tick_interval = 1.0 / self.tick_rate
+        """
+        Internal running loop
 
-        while self.running:
-            try:
-                start_time = time.time()
+        Ticks are paced against absolute deadlines on the event loop clock, so
+        sleep overshoot in one iteration does not push back every later tick.
+        Settings read by the loop are cached in locals and refreshed only when
+        _config_version changes.
 
-                # Execute one Tick
-                await self.tick_once()
+        The loop also keeps a moving average of how late each wake-up was and
+        wakes that much earlier next time, so the observed tick rate stays
+        close to the configured one. The single clock reading taken after each
+        tick doubles as the tick's _last_tick_time.
+        """
+        if self.timer_thread:
+            await self._run_threaded()
+            return
 
-                # Calculate the time to wait
-                elapsed = time.time() - start_time
-                wait_time = max(0, tick_interval - elapsed)
+        loop = asyncio.get_running_loop()
+        clock = loop.time
+        clock_offset = time.monotonic() - clock()
+        sleep_until = _sleep_until
+        config_version = -1
+        tick_once = self._tick
+        tick_interval = 1.0 / self.tick_rate
+        spin_wait = False
+        deadline = clock()
+        sleep_bias = 0.0
+
+        while True:
+            # Pick up changes made through set_tick_rate, callbacks or stop
+            if config_version != self._config_version:
+                if not self.running:
+                    break
+                config_version = self._config_version
+                tick_once = self._tick
+                tick_interval = 1.0 / self.tick_rate
+                spin_wait = self.high_precision and tick_interval < _SPIN_INTERVAL_THRESHOLD
 
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
+            try:
+                # Execute one Tick
+                await tick_once()
+                now = clock()
+                self._last_tick_time = now + clock_offset
+
+                # Wait until the next deadline, or resynchronize after a stall
+                deadline += tick_interval
+                if deadline > now and spin_wait:
+                    # Coarse sleep, then yield to the loop until the deadline
+                    if deadline - _SPIN_WINDOW > now:
+                        await sleep_until(loop, deadline - _SPIN_WINDOW)
+                    while clock() < deadline:
+                        await asyncio.sleep(0)
+                elif deadline > now:
+                    # Wake early by the predicted oversleep, but never in the past
+                    wake_at = deadline + _CLOCK_RESOLUTION - sleep_bias
+                    if wake_at < now + _CLOCK_RESOLUTION:
+                        wake_at = now + _CLOCK_RESOLUTION
+                    await sleep_until(loop, wake_at)
+                    oversleep = clock() - wake_at
+                    if oversleep < 0.0:
+                        oversleep = 0.0
+                    sleep_bias += _SLEEP_BIAS_SMOOTHING * (oversleep - sleep_bias)
+                else:
+                    deadline = now
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                # Record error but continue running
-                print(f"Tick execution error: {e}")
-                await asyncio.sleep(tick_interval)
+                # Record error but continue running, one tick from now rather
+                # than racing to catch up with missed deadlines
+                self._report_tick_error(e)
+                deadline = clock() + tick_interval
+                await sleep_until(loop, deadline)
+
+    async def _run_threaded(self) -> None:
+        """Internal running loop paced by a ThreadedTickDriver"""
+        config_version = self._config_version
+        tick_once = self._tick
+        driver = ThreadedTickDriver(asyncio.get_running_loop(), 1.0 / self.tick_rate)
+        driver.start()
+
+        try:
+            while True:
+                if config_version != self._config_version:
+                    if not self.running:
+                        break
+                    config_version = self._config_version
+                    tick_once = self._tick
+                    driver.set_interval(1.0 / self.tick_rate)
+
+                try:
+                    await tick_once()
+                    self._last_tick_time = time.monotonic()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    # Record error but continue running
+                    self._report_tick_error(e)
+
+                await driver.wait()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            driver.stop()
+
+    def _report_tick_error(self, error: Exception) -> None:
+        """
+        Log a tick error raised while running periodically
+
+        Only the 1st, 2nd, 4th, 8th, ... occurrence is logged, so a tree that
+        fails on every tick cannot flood the log and stall the loop.
+
+        Args:
+            error: Exception raised by the tick
+        """
+        self._error_count += 1
+        count = self._error_count
+        if count & (count - 1) == 0:
+            _logger.error(
+                "Tick execution error (%d so far): %s", count, error, exc_info=error
+            )
 
     def set_tick_rate(self, rate: float) -> None:
         """
@@ -160,6 +422,9 @@ class TickManager:
         if rate <= 0:
             raise ValueError("Execution frequency must be greater than 0")
         self.tick_rate = rate
+        self._config_version += 1
+        if self.scheduler is not None:
+            self.scheduler.set_tick_rate(self, rate)
 
     def set_root_node(self, root_node: BaseNode) -> None:
         """
@@ -195,7 +460,7 @@ class TickManager:
         Args:
             callback: Callback function, receive execution status as parameter
         """
-        self.on_tick = callback
+        self.on_tick = callback  # __setattr__ rebinds the hot path
 
     def set_on_status_change_callback(
         self, callback: Callable[[Status, Status], None]
@@ -206,7 +471,7 @@ class TickManager:
         Args:
             callback: Callback function, receive old status and new status as parameters
         """
-        self.on_status_change = callback
+        self.on_status_change = callback  # __setattr__ rebinds the hot path
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -219,7 +484,8 @@ class TickManager:
             "running": self.running,
             "tick_rate": self.tick_rate,
             "tick_count": self._tick_count,
-            "last_tick_time": self._last_tick_time,
+            "error_count": self._error_count,
+            "last_tick_time": self._last_tick_wall(),
             "last_status": self._last_status.name,
             "has_root_node": self.root_node is not None,
             "has_blackboard": self.blackboard is not None,
@@ -256,7 +522,18 @@ class TickManager:
         Returns:
             Last execution timestamp
         """
-        return self._last_tick_time
+        return self._last_tick_wall()
+
+    def _last_tick_wall(self) -> float:
+        """
+        Convert the monotonic last tick time to a wall-clock timestamp
+
+        Returns:
+            Wall-clock timestamp of the last tick, or 0.0 if never ticked
+        """
+        if not self._last_tick_time:
+            return 0.0
+        return time.time() - (time.monotonic() - self._last_tick_time)
 
     def get_last_status(self) -> Status:
         """
@@ -281,3 +558,222 @@ class TickManager:
         """String representation of the tick manager"""
         stats = self.get_stats()
         return f"TickManager(running={stats['running']}, tick_rate={stats['tick_rate']}, tick_count={stats['tick_count']})"
+
+
+class TickScheduler:
+    """
+    Tick Scheduler
+
+    Drives many TickManagers from a single event-loop task. One timer wakes
+    the scheduler for every deadline that falls due, and each due manager's
+    tick then runs as its own task, so N trees cost one wake-up instead of N
+    separate sleeping loops. A tree whose tick awaits I/O only delays itself:
+    a slot's next deadline is scheduled when its own tick completes, and a
+    slot is never ticked again while its previous tick is still running.
+
+    Per-manager scheduling data lives in parallel lists indexed by a slot
+    number, and the deadline heap only holds ``(deadline, slot, generation)``
+    tuples of plain numbers. Finding due managers therefore never touches the
+    TickManager objects themselves.
+
+    A manager is attached by setting its ``scheduler`` attribute before
+    ``start()``; it then registers itself here instead of creating a task.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scheduler"""
+        self._slots: Dict[int, int] = {}  # id(manager) -> slot
+        self._managers: List[Optional[TickManager]] = []
+        self._intervals: List[float] = []
+        self._generations: List[int] = []
+        self._deadlines: List[float] = []  # Deadline of each slot's latest tick
+        self._running: List[Optional[asyncio.Task]] = []  # Each slot's in-flight tick
+        self._free_slots: List[int] = []
+        # Entries whose generation no longer matches their slot are stale
+        self._heap: List[Tuple[float, int, int]] = []
+        self._waiter: Optional["asyncio.Future[None]"] = None
+        self._wake_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, manager: TickManager) -> None:
+        """
+        Start driving a tick manager, ticking it as soon as possible
+
+        Args:
+            manager: Tick manager to drive
+        """
+        loop = asyncio.get_running_loop()
+        self.unregister(manager)
+
+        interval = 1.0 / manager.tick_rate
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._managers[slot] = manager
+            self._intervals[slot] = interval
+        else:
+            slot = len(self._managers)
+            self._managers.append(manager)
+            self._intervals.append(interval)
+            self._generations.append(0)
+            self._deadlines.append(0.0)
+            self._running.append(None)
+        self._slots[id(manager)] = slot
+        self._schedule(slot, loop.time())
+
+    def _schedule(self, slot: int, deadline: float) -> None:
+        """Queue a slot's next tick and make sure the scheduler wakes for it"""
+        self._deadlines[slot] = deadline
+        heapq.heappush(self._heap, (deadline, slot, self._generations[slot]))
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        elif self._waiter is not None and deadline < self._wake_at:
+            # Wake the scheduler so it can honor the new, earlier deadline
+            _release_waiter(self._waiter)
+
+    def unregister(self, manager: TickManager) -> bool:
+        """
+        Stop driving a tick manager
+
+        Args:
+            manager: Tick manager to remove
+
+        Returns:
+            True if the manager was registered
+        """
+        slot = self._slots.pop(id(manager), None)
+        if slot is None:
+            return False
+        self._managers[slot] = None
+        self._generations[slot] += 1
+        # Stop an in-flight tick, as stop() does for a manager's own task,
+        # unless the manager is being stopped from inside that tick
+        in_flight = self._running[slot]
+        if in_flight is not None:
+            self._running[slot] = None
+            if in_flight is not asyncio.current_task():
+                in_flight.cancel()
+        self._free_slots.append(slot)
+        return True
+
+    def set_tick_rate(self, manager: TickManager, rate: float) -> None:
+        """
+        Update the interval of a registered manager
+
+        Args:
+            manager: Registered tick manager
+            rate: New execution frequency (times per second)
+        """
+        slot = self._slots.get(id(manager))
+        if slot is None:
+            return
+        previous_interval = self._intervals[slot]
+        self._intervals[slot] = 1.0 / rate
+        # A slot that is ticking picks the interval up when its tick completes;
+        # a waiting slot has its pending deadline moved to the new rate now
+        if self._running[slot] is None:
+            self._generations[slot] += 1  # Invalidates the old heap entry
+            self._schedule(slot, self._deadlines[slot] - previous_interval + self._intervals[slot])
+
+    def is_registered(self, manager: TickManager) -> bool:
+        """
+        Check whether a tick manager is driven by this scheduler
+
+        Args:
+            manager: Tick manager to check
+
+        Returns:
+            True if registered, False otherwise
+        """
+        return id(manager) in self._slots
+
+    def get_manager_count(self) -> int:
+        """
+        Get the number of registered tick managers
+
+        Returns:
+            Number of registered managers
+        """
+        return len(self._slots)
+
+    async def close(self) -> None:
+        """Stop the scheduler task and in-flight ticks, and forget all managers"""
+        tasks = [task for task in self._running if task is not None]
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._slots.clear()
+        self._managers.clear()
+        self._intervals.clear()
+        self._generations.clear()
+        self._deadlines.clear()
+        self._running.clear()
+        self._free_slots.clear()
+        self._heap.clear()
+
+    async def _tick_slot(self, slot: int, generation: int, manager: TickManager) -> None:
+        """Run one tick of a slot's manager and schedule the slot's next deadline"""
+        this_task = asyncio.current_task()
+        error: Optional[Exception] = None
+        try:
+            await manager._tick()
+        except Exception as e:
+            error = e
+        finally:
+            if self._running[slot] is this_task:
+                self._running[slot] = None
+
+        if self._generations[slot] != generation:
+            return  # Unregistered while ticking
+        now = asyncio.get_running_loop().time()
+        interval = self._intervals[slot]
+        if error is not None:
+            # Record error but keep the manager scheduled, one tick from now
+            # rather than racing to catch up with missed deadlines
+            manager._report_tick_error(error)
+            self._schedule(slot, now + interval)
+            return
+        manager._last_tick_time = time.monotonic()
+        next_deadline = self._deadlines[slot] + interval
+        self._schedule(slot, next_deadline if next_deadline > now else now)
+
+    async def _run(self) -> None:
+        """Internal scheduling loop"""
+        loop = asyncio.get_running_loop()
+        clock = loop.time
+        heap = self._heap
+        managers = self._managers
+        generations = self._generations
+        running = self._running
+
+        while True:
+            # Drop entries of managers that were unregistered
+            while heap and generations[heap[0][1]] != heap[0][2]:
+                heapq.heappop(heap)
+            if not heap:
+                break  # Ticks still in flight restart the loop when they reschedule
+
+            deadline = heap[0][0]
+            if deadline > clock() + _CLOCK_RESOLUTION:
+                waiter = loop.create_future()
+                self._wake_at = deadline
+                handle = loop.call_at(deadline + _CLOCK_RESOLUTION, _release_waiter, waiter)
+                self._waiter = waiter
+                try:
+                    await waiter
+                finally:
+                    handle.cancel()
+                    self._waiter = None
+                continue
+
+            # Start every manager that is due within the clock resolution;
+            # a slot whose previous tick is still running is left alone
+            due_before = clock() + _CLOCK_RESOLUTION
+            while heap and heap[0][0] <= due_before:
+                _, slot, generation = heapq.heappop(heap)
+                manager = managers[slot]
+                if generations[slot] == generation and running[slot] is None and manager is not None:
+                    running[slot] = loop.create_task(self._tick_slot(slot, generation, manager))
@@ -5,40 +5,81 @@ A high-performance asynchronous behavior forest framework that enables multiple
 to collaborate through various communication patterns, supporting complex multi-agent systems.
 """
 
-from typing import Any
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
 
 from .core import BehaviorForest, ForestNode, ForestNodeType
 from .config import ForestConfig, ForestConfigPresets
 from .forest_manager import ForestManager
 
-# Advanced features
-try:
-    from .plugin_system import (
-        BasePlugin,
-        PluginInfo,
-        PluginManager,
-        create_plugin_manager,
-    )
-    PLUGIN_SYSTEM_AVAILABLE = True
-except ImportError:
-    PLUGIN_SYSTEM_AVAILABLE = False
-    PluginManager: Any = None  # type: ignore[no-redef]
-    BasePlugin: Any = None  # type: ignore[no-redef]
-    PluginInfo: Any = None  # type: ignore[no-redef]
-    create_plugin_manager: Any = None  # type: ignore[no-redef]
-
-try:
-    from .performance import (
-        PerformanceMonitor,
-        create_performance_monitor,
-        monitor_forest_performance,
+# Advanced features are imported on first attribute access (PEP 562), so
+# ``import abtree.forest`` does not pay for modules the caller never uses.
+# Names resolve to None when their module cannot be imported.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "PluginManager": ".plugin_system",
+    "BasePlugin": ".plugin_system",
+    "PluginInfo": ".plugin_system",
+    "create_plugin_manager": ".plugin_system",
+    "PerformanceMonitor": ".performance",
+    "create_performance_monitor": ".performance",
+    "monitor_forest_performance": ".performance",
+}
+
+_AVAILABILITY_FLAGS: Dict[str, str] = {
+    "PLUGIN_SYSTEM_AVAILABLE": ".plugin_system",
+    "PERFORMANCE_MONITORING_AVAILABLE": ".performance",
+}
+
+# Third-party packages each advanced feature needs beyond the standard library
+_FEATURE_REQUIREMENTS: Dict[str, Tuple[str, ...]] = {
+    ".plugin_system": ("typing_extensions",),
+    ".performance": (),
+}
+
+
+def _is_feature_available(module_name: str) -> bool:
+    """
+    Check whether an advanced feature's dependencies are installed
+
+    Uses importlib.util.find_spec, which locates the packages without
+    executing them, so the check is cheap even when a dependency is missing.
+    """
+    return all(
+        importlib.util.find_spec(requirement) is not None
+        for requirement in _FEATURE_REQUIREMENTS[module_name]
     )
-    PERFORMANCE_MONITORING_AVAILABLE = True
-except ImportError:
-    PERFORMANCE_MONITORING_AVAILABLE = False
-    PerformanceMonitor: Any = None  # type: ignore[no-redef]
-    create_performance_monitor: Any = None  # type: ignore[no-redef]
-    monitor_forest_performance: Any = None  # type: ignore[no-redef]
+
+
+def _import_optional(module_name: str) -> Optional[ModuleType]:
+    """Import an optional submodule, returning None if it is unavailable"""
+    if not _is_feature_available(module_name):
+        return None
+    try:
+        return importlib.import_module(module_name, __name__)
+    except ImportError:
+        return None
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve advanced features and availability flags on first access"""
+    if name in _LAZY_ATTRIBUTES:
+        module = _import_optional(_LAZY_ATTRIBUTES[name])
+        value: Any = getattr(module, name) if module is not None else None
+    elif name in _AVAILABILITY_FLAGS:
+        value = _is_feature_available(_AVAILABILITY_FLAGS[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the result so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily resolved names in dir()"""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_AVAILABILITY_FLAGS))
 
 __all__ = [
     # Core classes
@@ -13,11 +13,18 @@ Optimized for zero-copy data transfer to minimize memory overhead and improve pe
 """
 
 import asyncio
+import bisect
+import logging
+import sys
 import time
+from collections import Counter, defaultdict, deque
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Set, Union, MutableMapping
+from typing import (
+    AbstractSet, Any, Awaitable, Callable, ClassVar, Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple,
+    Union, Mapping, MutableMapping
+)
 
 from ..core.status import Status
 from ..engine.blackboard import Blackboard
@@ -26,6 +33,96 @@ from ..engine.behavior_tree import BehaviorTree
 from ..nodes.action import Action
 from .core import BehaviorForest, ForestNode
 
+_logger = logging.getLogger(__name__)
+
+# Wall-clock source for event, log and history timestamps, bound once so the
+# hot paths skip the module attribute lookup
+_now = time.time
+
+# Task board events accepted by register_claim_callback
+TASK_EVENTS = frozenset({"task_available", "task_claimed", "task_completed", "task_failed"})
+
+# Marks a state key that has never been written
+_MISSING = object()
+
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Callback registries map a topic, key or channel to (callback, is_coroutine)
+# entries, classified once so dispatch does not re-inspect them per event
+_CallbackRegistry = Dict[str, List[Tuple[Callable, bool]]]
+
+
+def _add_callback(registry: _CallbackRegistry, key: str, callback: Callable) -> None:
+    """Register callback under key, classifying it as sync or coroutine once"""
+    registry[key].append((callback, asyncio.iscoroutinefunction(callback)))
+
+
+def _remove_callback(registry: _CallbackRegistry, key: str, callback: Callable) -> bool:
+    """Remove the first entry registered for callback under key"""
+    entries = registry.get(key)
+    if entries:
+        for index, (registered, _) in enumerate(entries):
+            if registered == callback:
+                del entries[index]
+                return True
+    return False
+
+
+def _registered_keys(registry: _CallbackRegistry) -> List[str]:
+    """Keys with at least one callback; bound or emptied keys keep an empty list"""
+    return [key for key, callbacks in registry.items() if callbacks]
+
+
+def _as_set(values: Iterable[str]) -> AbstractSet[str]:
+    """Return values as a set, converting only when it is not one already"""
+    if isinstance(values, (set, frozenset)):
+        return values
+    return frozenset(values)
+
+
+class DropOldestQueue(asyncio.Queue, Sequence[Any]):
+    """
+    Bounded asyncio queue for external IO data
+    
+    Producers never block: putting into a full queue discards the oldest item.
+    Consumers can ``await queue.get()`` instead of polling, while the queue
+    is still a read-only Sequence with the append/clear operations of the
+    deques it replaces.
+    
+    On Python < 3.10 the queue binds to the event loop current at creation,
+    so create it (and its middleware) inside the loop that consumes it.
+    """
+    
+    _queue: Deque[Any]  # Storage created by asyncio.Queue._init
+    
+    def put_nowait(self, item: Any) -> None:
+        """Put an item, discarding the oldest one if the queue is full"""
+        if self.full():
+            self.get_nowait()
+            self.task_done()  # The dropped item will never be processed
+        super().put_nowait(item)
+    
+    append = put_nowait
+    
+    def clear(self) -> None:
+        """Discard all queued items"""
+        while not self.empty():
+            self.get_nowait()
+            self.task_done()
+    
+    def __len__(self) -> int:
+        return self.qsize()
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._queue)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return list(self._queue)[index]  # deque itself cannot be sliced
+        return self._queue[index]
+
 
 class CommunicationType(Enum):
     """Communication type enumeration"""
@@ -38,7 +135,7 @@ class CommunicationType(Enum):
     EXTERNAL_IO = auto()
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Message:
     """Base message class for communication - optimized for zero-copy"""
     id: str
@@ -49,14 +146,14 @@ class Message:
     priority: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Request(Message):
     """Request message for Req/Resp pattern - optimized for zero-copy"""
     method: str = ""
     params: Dict[str, Any] = field(default_factory=dict)  # Direct reference
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Response(Message):
     """Response message for Req/Resp pattern - optimized for zero-copy"""
     request_id: str = ""
@@ -64,13 +161,13 @@ class Response(Message):
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Task:
     """Task for Task Board pattern - optimized for zero-copy"""
     id: str
     title: str
     description: str
-    requirements: Set[str] = field(default_factory=set)  # Direct reference
+    requirements: FrozenSet[str] = field(default_factory=frozenset)  # Immutable once published
     priority: int = 0
     status: str = "pending"  # pending, claimed, completed, failed
     claimed_by: Optional[str] = None
@@ -78,6 +175,90 @@ class Task:
     data: Dict[str, Any] = field(default_factory=dict)  # Direct reference
 
 
+class _ItemAccess(Mapping[str, Any]):
+    """
+    Read-only mapping view of dataclass fields, for code written against info dicts
+    
+    dict(entry), {**entry}, keys() and items() keep working; use as_dict()
+    where a real dict is required, e.g. for json.dumps.
+    """
+    
+    __slots__ = ()
+    __dataclass_fields__: ClassVar[Dict[str, Any]]
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dataclass_fields__)
+    
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+    
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self.__dataclass_fields__
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field value, or default for an unknown key"""
+        return getattr(self, key, default) if key in self else default
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the fields as a new dict; the values are not copied"""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class TopicEvent(_ItemAccess):
+    """Published or externally received topic event - optimized for zero-copy"""
+    topic: str
+    data: Any  # Direct reference, no copying
+    source: str
+    timestamp: float
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ChannelEvent(_ItemAccess):
+    """External input or output item - optimized for zero-copy"""
+    channel: str
+    data: Any  # Direct reference, no copying
+    source: str
+    timestamp: float
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class AccessLogEntry(_ItemAccess):
+    """Shared blackboard access log entry - optimized for zero-copy"""
+    timestamp: float
+    operation: str
+    key: str
+    value: Any  # Direct reference
+    source: str
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class StateHistoryEntry(_ItemAccess):
+    """Recorded change of a watched state key - optimized for zero-copy"""
+    timestamp: float
+    old_value: Any  # Direct reference
+    new_value: Any  # Direct reference
+    source: str
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class CallLogEntry(_ItemAccess):
+    """Behavior call log entry; the outcome fields are filled in when the call returns"""
+    timestamp: float
+    behavior: str
+    params: Dict[str, Any]  # Direct reference
+    source: str
+    result: Any = None  # Direct reference
+    success: Optional[bool] = None  # None while the call is running
+    error: Optional[str] = None
+
+
 class CommunicationMiddleware:
     """
     Unified Communication Middleware - Zero-Copy Optimized
@@ -93,57 +274,137 @@ class CommunicationMiddleware:
     Optimized for zero-copy data transfer to minimize memory overhead.
     """
     
-    def __init__(self, name: str = "CommunicationMiddleware"):
+    def __init__(self, name: str = "CommunicationMiddleware", batch_window_us: int = 0,
+                 async_queues: bool = False, deferred_handlers: bool = False,
+                 record_logs: bool = True, log_reads: bool = True):
+        """
+        Initialize the middleware
+        
+        Args:
+            name: Middleware name
+            batch_window_us: Micro-batching window for publish() in microseconds.
+                With 0 (the default) every event is delivered before publish()
+                returns; otherwise events are buffered and delivered together
+                once per window.
+            async_queues: Back the incoming, input and output queues with
+                DropOldestQueue so consumers can await new items. The default
+                bounded deques are cheaper for producers when nothing awaits.
+            deferred_handlers: Hand external subscriber, input and output
+                handlers to one consumer task per channel instead of running
+                them before the call returns. Await flush() to wait for them.
+            record_logs: Keep the blackboard access log, state history and
+                behavior call log. Without them set/get only touch the
+                blackboard and update_state only stores and notifies.
+            log_reads: Include get() calls in the access log. Turning it off
+                keeps set/remove auditing while reads, usually the bulk of
+                blackboard traffic, skip logging.
+        """
         self.name = name
         self.forest: Optional[BehaviorForest] = None
         self.enabled = True
+        self.record_logs = record_logs
+        self.log_reads = log_reads
         
         # Shared EventSystem for all behavior trees - zero-copy optimized
         self.shared_event_dispatcher = EventDispatcher()
-        self.event_dispatcher_nodes: Dict[str, str] = {}  # node_name -> event_dispatcher_key
+        self.event_dispatcher_nodes: Set[str] = set()  # Names of trees on the shared dispatcher
         
         # Pub/Sub components - using direct references
-        self.subscribers: Dict[str, List[Callable]] = {}
-        self.event_history: List[Dict[str, Any]] = []
+        self.subscribers: _CallbackRegistry = defaultdict(list)
         self.max_history = 1000
+        self.event_history: Deque[TopicEvent] = deque(maxlen=self.max_history)
+        self._event_history_by_topic: Dict[str, Deque[TopicEvent]] = defaultdict(
+            lambda: deque(maxlen=self.max_history)
+        )
+        self.batch_window_us = batch_window_us
+        self._publish_buffer: List[Tuple[str, TopicEvent]] = []
+        self._flush_task: Optional[asyncio.Task] = None
         
         # Req/Resp components - using direct references
-        self.services: Dict[str, Callable] = {}
-        self.pending_requests: Dict[str, asyncio.Future] = {}
-        self.request_counter = 0
+        self.services: Dict[str, Tuple[Callable, bool]] = {}
         
         # Shared Blackboard components - using direct references
         self.shared_blackboard = Blackboard()
-        self.access_log: List[Dict[str, Any]] = []
         self.max_log_size = 1000
+        self.access_log: Deque[AccessLogEntry] = deque(maxlen=self.max_log_size)
+        self._access_log_by_source: Dict[str, Deque[AccessLogEntry]] = defaultdict(
+            lambda: deque(maxlen=self.max_log_size)
+        )
         
         # State Watching components - using direct references
-        self.watchers: Dict[str, List[Callable]] = {}
+        self.watchers: _CallbackRegistry = defaultdict(list)
         self.state_cache: Dict[str, Any] = {}
-        self.state_history: Dict[str, List[Dict[str, Any]]] = {}
+        self.state_history: Dict[str, Deque[StateHistoryEntry]] = {}
         self.max_history_per_key = 100
         
         # Behavior Call components - using direct references
-        self.registered_behaviors: Dict[str, Callable] = {}
-        self.call_log: List[Dict[str, Any]] = []
+        self.registered_behaviors: Dict[str, Tuple[Callable, bool]] = {}
+        self.call_log: Deque[CallLogEntry] = deque(maxlen=self.max_log_size)
+        self._call_log_by_behavior: Dict[str, Deque[CallLogEntry]] = defaultdict(
+            lambda: deque(maxlen=self.max_log_size)
+        )
         
         # Task Board components - using direct references
         self.tasks: Dict[str, Task] = {}
         self.task_counter = 0
-        self.claim_callbacks: Dict[str, List[Callable]] = {}
+        # Secondary indices: sorted list of (-priority, sequence, task_id) for pending
+        # tasks (stale entries are dropped lazily) and claimant -> claimed task
+        # ids (a dict used as an insertion-ordered set)
+        self._pending_order: List[Tuple[int, int, str]] = []
+        self._claimed_by: Dict[str, Dict[str, None]] = {}
+        # task_id -> first claimant; dict.setdefault makes claiming atomic
+        self._claim_owner: Dict[str, str] = {}
+        # Canonical requirement sets: one shared frozenset per distinct set
+        self._requirement_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        # Running per-status task counts, kept in step by _set_task_status
+        self._status_counts: Counter = Counter()
+        self.claim_callbacks: _CallbackRegistry = defaultdict(list)
+        # Async task board notifications queued as (event, callbacks, task) and
+        # run in order by a single drain task per batch
+        self._pending_notifications: List[Tuple[str, List[Tuple[Callable, bool]], Task]] = []
+        self._notify_task: Optional[asyncio.Task] = None
         
         # External Communication components - using direct references
-        self.out_publishers: Dict[str, List[Callable]] = {}
-        self.in_subscribers: Dict[str, List[Callable]] = {}
-        self.incoming_queue: List[Dict[str, Any]] = []
+        self.out_publishers: _CallbackRegistry = defaultdict(list)
+        self.in_subscribers: _CallbackRegistry = defaultdict(list)
         self.max_incoming_queue_size = 1000
+        self.incoming_queue = self._create_io_queue(self.max_incoming_queue_size, async_queues)
+        self._incoming_by_topic: Dict[str, Deque[TopicEvent]] = defaultdict(
+            lambda: deque(maxlen=self.max_incoming_queue_size)
+        )
         
         # ExternalIO components - using direct references
-        self.external_input_handlers: Dict[str, List[Callable]] = {}
-        self.external_output_handlers: Dict[str, List[Callable]] = {}
-        self.input_queue: List[Dict[str, Any]] = []
-        self.output_queue: List[Dict[str, Any]] = []
+        self.external_input_handlers: _CallbackRegistry = defaultdict(list)
+        self.external_output_handlers: _CallbackRegistry = defaultdict(list)
         self.max_io_queue_size = 1000
+        self.input_queue = self._create_io_queue(self.max_io_queue_size, async_queues)
+        self.output_queue = self._create_io_queue(self.max_io_queue_size, async_queues)
+        self._input_by_channel: Dict[str, Deque[ChannelEvent]] = defaultdict(
+            lambda: deque(maxlen=self.max_io_queue_size)
+        )
+        self._output_by_channel: Dict[str, Deque[ChannelEvent]] = defaultdict(
+            lambda: deque(maxlen=self.max_io_queue_size)
+        )
+        # Awaitable queues are drained by consumers, so filtered reads scan them instead
+        self.async_queues = async_queues
+        
+        # Deferred handler dispatch: (registry label, channel) -> queue drained by one consumer task
+        self.deferred_handlers = deferred_handlers
+        self._handler_queues: Dict[Tuple[str, str], "asyncio.Queue[Union[TopicEvent, ChannelEvent]]"] = {}
+        self._handler_consumers: List[asyncio.Task] = []
+        
+        # External input events for the forest dispatcher, emitted together once per loop iteration
+        self._pending_forest_emits: List[Tuple[str, Any]] = []
+        self._forest_emit_scheduled = False
+        self._forest_emit_tasks: Set[asyncio.Task] = set()  # Referenced until they finish
+        self._input_event_names: Dict[str, str] = {}  # channel -> interned "external_input_<channel>"
+    
+    @staticmethod
+    def _create_io_queue(max_size: int, async_queue: bool) -> Union[Deque[Any], DropOldestQueue]:
+        """Create a bounded IO queue that drops its oldest entry when full"""
+        if async_queue:
+            return DropOldestQueue(maxsize=max_size)
+        return deque(maxlen=max_size)
     
     def initialize(self, forest: BehaviorForest) -> None:
         """Initialize middleware with forest and setup shared EventSystem"""
@@ -154,24 +415,32 @@ class CommunicationMiddleware:
     
     def _setup_shared_event_dispatcher(self) -> None:
         """Setup shared EventSystem for all behavior trees in the forest"""
-        if not self.forest:
+        forest = self.forest
+        if not forest:
             return
         
+        # Read the shared objects once instead of on every loop iteration
+        shared_dispatcher = self.shared_event_dispatcher
+        forest_blackboard = forest.forest_blackboard
+        add_dispatcher_node = self.event_dispatcher_nodes.add
+        
         # Store shared EventSystem in forest's blackboard
-        self.forest.forest_blackboard.set("__event_dispatcher", self.shared_event_dispatcher)
+        forest_blackboard.set("__event_dispatcher", shared_dispatcher)
         
         # Setup shared EventSystem and blackboard for each behavior tree
-        for node_name, node in self.forest.nodes.items():
+        for node_name, node in forest.nodes.items():
+            tree = node.tree
+            blackboard = tree.blackboard
             # Store shared EventSystem in each tree's blackboard
-            if node.tree.blackboard:
-                node.tree.blackboard.set("__event_dispatcher", self.shared_event_dispatcher)
+            if blackboard is not None:
+                blackboard.set("__event_dispatcher", shared_dispatcher)
                 # Also set the tree's event_dispatcher to the shared one
-                node.tree.event_dispatcher = self.shared_event_dispatcher
+                tree.event_dispatcher = shared_dispatcher
                 # Set tree's blackboard to forest's shared blackboard
-                node.tree.blackboard = self.forest.forest_blackboard
-                self.event_dispatcher_nodes[node_name] = "__event_dispatcher"
+                tree.blackboard = forest_blackboard
+                add_dispatcher_node(node_name)
         
-        print(f"🔗 Setup shared EventSystem and blackboard for {len(self.forest.nodes)} behavior trees")
+        _logger.debug("Set up shared EventSystem and blackboard for %d behavior trees", len(forest.nodes))
     
     async def pre_tick(self) -> None:
         """Pre-tick processing"""
@@ -191,9 +460,7 @@ class CommunicationMiddleware:
             topic: Topic to subscribe to
             callback: Callback function to execute when event is published
         """
-        if topic not in self.subscribers:
-            self.subscribers[topic] = []
-        self.subscribers[topic].append(callback)
+        _add_callback(self.subscribers, topic, callback)
     
     def unsubscribe(self, topic: str, callback: Callable) -> bool:
         """
@@ -206,10 +473,7 @@ class CommunicationMiddleware:
         Returns:
             True if callback was found and removed
         """
-        if topic in self.subscribers and callback in self.subscribers[topic]:
-            self.subscribers[topic].remove(callback)
-            return True
-        return False
+        return _remove_callback(self.subscribers, topic, callback)
     
     async def publish(self, topic: str, data: Any, source: str) -> None:
         """
@@ -224,60 +488,238 @@ class CommunicationMiddleware:
             return
         
         # Create event info with direct reference to data (no copying)
-        event_info = {
-            "topic": topic,
-            "data": data,
-            "source": source,
-            "timestamp": time.time()
-        }
+        event_info = TopicEvent(topic, data, source, _now())
+        # Bounded deques drop the oldest entry in O(1) once full
         self.event_history.append(event_info)
+        self._event_history_by_topic[topic].append(event_info)
         
-        # Trim history if needed
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
+        if self.batch_window_us > 0:
+            # Deliver with the rest of this window's events
+            self._publish_buffer.append((topic, event_info))
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_after(self.batch_window_us / 1e6))
+            return
         
-        # Execute internal callbacks with direct event info reference
-        if topic in self.subscribers:
-            tasks = []
-            for callback in self.subscribers[topic]:
-                if asyncio.iscoroutinefunction(callback):
-                    task = asyncio.create_task(callback(event_info))
-                else:
-                    task = asyncio.create_task(self._run_sync_callback(callback, event_info))
-                tasks.append(task)
-            
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+        await self._deliver_event(topic, event_info)
+    
+    def bind_publisher(self, topic: str, source: str) -> Callable[[Any], Awaitable[None]]:
+        """
+        Bind a publisher to one topic and source - zero-copy optimized
         
-        # Also trigger external communication callbacks if registered
-        if topic in self.out_publishers:
-            tasks = []
-            for callback in self.out_publishers[topic]:
-                if asyncio.iscoroutinefunction(callback):
-                    task = asyncio.create_task(callback(event_info))
-                else:
-                    task = asyncio.create_task(self._run_sync_external_callback(callback, event_info))
-                tasks.append(task)
+        The returned coroutine function takes only the event data and
+        behaves like publish(topic, data, source). It resolves the topic's
+        history and callback lists once, so a node that publishes to the same
+        topic every tick skips those lookups on each call.
+        
+        Args:
+            topic: Topic to publish to
+            source: Source node name
             
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
-    
-    async def _run_sync_callback(self, callback: Callable, event_info: Dict[str, Any]) -> None:
-        """Run synchronous callback in async context - zero-copy optimized"""
-        try:
-            callback(event_info)  # Direct event info reference
-        except Exception as e:
-            print(f"PubSub callback error: {e}")
+        Returns:
+            Coroutine function publishing its data argument to the topic
+        """
+        history = self.event_history
+        topic_history = self._event_history_by_topic[topic]
+        # Registries only ever mutate these lists in place, so they stay current
+        callbacks = self.subscribers[topic]
+        publishers = self.out_publishers[topic]
+        dispatch = self._dispatch_callbacks
+        
+        async def publish_bound(data: Any) -> None:
+            if not self.enabled or self.batch_window_us > 0:
+                await self.publish(topic, data, source)
+                return
+            event_info = TopicEvent(topic, data, source, _now())
+            history.append(event_info)
+            topic_history.append(event_info)
+            if callbacks:
+                await dispatch(callbacks, (event_info,), "PubSub callback error")
+            if publishers:
+                await dispatch(publishers, (event_info,), "External publisher callback error")
+        
+        return publish_bound
+    
+    async def _deliver_event(self, topic: str, event_info: TopicEvent) -> None:
+        """Run subscriber and external publisher callbacks for one event"""
+        # Execute internal callbacks with direct event info reference
+        callbacks = self.subscribers.get(topic)
+        if callbacks:
+            await self._dispatch_callbacks(callbacks, (event_info,), "PubSub callback error")
+
+        # Also trigger external communication callbacks if registered
+        publishers = self.out_publishers.get(topic)
+        if publishers:
+            await self._dispatch_callbacks(publishers, (event_info,), "External publisher callback error")
+    
+    async def _flush_after(self, delay: float) -> None:
+        """Deliver buffered publish events once the batching window closes"""
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self.flush()
+    
+    async def flush(self) -> None:
+        """
+        Deliver all buffered publish events now
+        
+        Also waits for queued async task board callbacks. Otherwise it only
+        has an effect when micro-batching or deferred handlers are enabled.
+        Callers that need their events handled before continuing can await it.
+        """
+        pending = self._publish_buffer
+        if pending:
+            self._publish_buffer = []
+            await asyncio.gather(*[self._deliver_event(topic, event_info) for topic, event_info in pending])
+        
+        # Emit coalesced forest events now rather than on the next loop iteration
+        if self._pending_forest_emits:
+            await self._emit_forest_events()
+        
+        # Wait for queued async task board callbacks
+        if self._notify_task is not None:
+            await self._notify_task
+        
+        # Wait for deferred external handlers to catch up
+        for queue in tuple(self._handler_queues.values()):
+            await queue.join()
+    
+    def _schedule_forest_emits(self) -> None:
+        """Loop callback that hands this iteration's forest events to one task"""
+        self._forest_emit_scheduled = False
+        if self._pending_forest_emits:
+            emit_task = asyncio.get_running_loop().create_task(self._emit_forest_events())
+            self._forest_emit_tasks.add(emit_task)
+            emit_task.add_done_callback(self._forest_emit_tasks.discard)
+    
+    async def _emit_forest_events(self) -> None:
+        """Emit all buffered external input events with one emit_many call"""
+        pending = self._pending_forest_emits
+        self._pending_forest_emits = []
+        if pending and self.forest is not None:
+            await self.forest.forest_event_dispatcher.emit_many(pending, source="external")
+    
+    async def close(self) -> None:
+        """
+        Stop the middleware's background tasks
+        
+        Cancels the deferred handler consumers, the micro-batch flush timer,
+        the task board notification drain and every forest event emit task.
+        Items still queued for them are discarded; await flush() first to
+        deliver them.
+        """
+        background = self._handler_consumers
+        self._handler_consumers = []
+        self._handler_queues.clear()
+        for pending_task in (self._flush_task, self._notify_task, *self._forest_emit_tasks):
+            if pending_task is not None and not pending_task.done():
+                background.append(pending_task)
+        self._flush_task = self._notify_task = None
+        self._forest_emit_tasks.clear()
+        self._publish_buffer = []
+        self._pending_notifications = []
+        self._pending_forest_emits = []
+        
+        for pending_task in background:
+            pending_task.cancel()
+        if background:
+            await asyncio.gather(*background, return_exceptions=True)
+    
+    async def _dispatch_callbacks(self, callbacks: List[Tuple[Callable, bool]],
+                                  args: Tuple[Any, ...], error_label: str) -> None:
+        """
+        Run registered callbacks for one event - zero-copy optimized
+        
+        Sync callbacks run inline. A single coroutine callback is awaited
+        directly and several are gathered. Errors are logged and never
+        propagate to the caller.
+        
+        Args:
+            callbacks: Registered (callback, is_coroutine) entries
+            args: Arguments passed to every callback (by reference)
+            error_label: Message logged with a callback's traceback
+        """
+        coroutines: List[Awaitable[Any]] = []
+        schedule = coroutines.append
+        # Iterate over a snapshot so callbacks may unsubscribe themselves
+        for callback, is_coroutine in tuple(callbacks):
+            if is_coroutine:
+                schedule(callback(*args))
+                continue
+            try:
+                callback(*args)
+            except Exception:
+                _logger.exception("%s", error_label)
+        
+        if len(coroutines) == 1:
+            try:
+                await coroutines[0]
+            except Exception:
+                _logger.exception("%s", error_label)
+        elif coroutines:
+            for result in await asyncio.gather(*coroutines, return_exceptions=True):
+                if isinstance(result, Exception):
+                    _logger.error("%s", error_label, exc_info=result)
     
-    def get_subscribers(self, topic: str) -> List[Callable]:
+    async def _run_handlers(self, registry: _CallbackRegistry, label: str,
+                            channel: str, info: Union[TopicEvent, ChannelEvent]) -> None:
+        """
+        Run a channel's external handlers now, or queue them when deferred
+        
+        Args:
+            registry: Handler registry keyed by channel or topic
+            label: Registry label, also used in error messages
+            channel: Channel or topic the item belongs to
+            info: Item passed to every handler (by reference)
+        """
+        if not self.deferred_handlers:
+            handlers = registry.get(channel)
+            if handlers:
+                await self._dispatch_callbacks(handlers, (info,), f"{label} error")
+            return
+        
+        queue = self._handler_queues.get((label, channel))
+        if queue is None:
+            queue = self._handler_queues[(label, channel)] = asyncio.Queue()
+            self._handler_consumers.append(
+                asyncio.create_task(self._consume_handler_queue(queue, registry, label, channel))
+            )
+        queue.put_nowait(info)
+    
+    async def _consume_handler_queue(self, queue: "asyncio.Queue[Union[TopicEvent, ChannelEvent]]",
+                                     registry: _CallbackRegistry,
+                                     label: str, channel: str) -> None:
+        """Drain one channel's deferred handler queue, a batch at a time"""
+        error_label = f"{label} error"
+        get_nowait = queue.get_nowait
+        task_done = queue.task_done
+        dispatch = self._dispatch_callbacks
+        while True:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            # Look the handlers up once per batch so late registrations apply
+            handlers = registry.get(channel)
+            for info in batch:
+                if handlers:
+                    await dispatch(handlers, (info,), error_label)
+                task_done()
+    
+    def get_subscribers(self, topic: str) -> Tuple[Callable, ...]:
         """Get subscribers for a topic - zero-copy optimized"""
-        return self.subscribers.get(topic, [])
+        return tuple(callback for callback, _ in self.subscribers.get(topic, ()))
     
-    def get_event_history(self, topic: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get event history - zero-copy optimized"""
+    def get_event_history(self, topic: Optional[str] = None) -> Tuple[TopicEvent, ...]:
+        """
+        Get event history - zero-copy optimized
+        
+        Returns an immutable snapshot; the entries themselves are not copied.
+        """
         if topic is None:
-            return self.event_history  # Direct reference
-        return [event for event in self.event_history if event["name"] == topic]
+            return tuple(self.event_history)
+        return tuple(self._event_history_by_topic.get(topic, ()))  # Per-topic index
     
     # ==================== Req/Resp Methods - Zero-Copy Optimized ====================
     
@@ -289,7 +731,7 @@ class CommunicationMiddleware:
             service_name: Name of the service
             handler: Handler function for the service
         """
-        self.services[service_name] = handler
+        self.services[service_name] = (handler, asyncio.iscoroutinefunction(handler))
     
     def unregister_service(self, service_name: str) -> bool:
         """
@@ -318,19 +760,17 @@ class CommunicationMiddleware:
         Returns:
             Response from the service
         """
-        if not self.enabled or service_name not in self.services:
+        service = self.services.get(service_name)
+        if not self.enabled or service is None:
             raise ValueError(f"Service '{service_name}' not found")
         
-        handler = self.services[service_name]
-        
+        handler, is_coroutine = service
         try:
-            if asyncio.iscoroutinefunction(handler):
-                result = await handler(params, source)  # Direct params reference
-            else:
-                result = handler(params, source)  # Direct params reference
-            return result
-        except Exception as e:
-            print(f"Service '{service_name}' error: {e}")
+            if is_coroutine:
+                return await handler(params, source)  # Direct params reference
+            return handler(params, source)  # Sync handlers are called inline
+        except Exception:
+            _logger.exception("Service %r error", service_name)
             raise
     
     def get_available_services(self) -> List[str]:
@@ -352,7 +792,8 @@ class CommunicationMiddleware:
             return
         
         self.shared_blackboard.set(key, value)  # Direct reference storage
-        self._log_access("set", key, value, source)
+        if self.record_logs:
+            self._log_access("set", key, value, source)
     
     def get(self, key: str, default: Any = None, source: str = "") -> Any:
         """
@@ -370,7 +811,8 @@ class CommunicationMiddleware:
             return default
         
         value = self.shared_blackboard.get(key, default)  # Direct reference retrieval
-        self._log_access("get", key, value, source)
+        if self.log_reads and self.record_logs:
+            self._log_access("get", key, value, source)
         return value
     
     def has(self, key: str) -> bool:
@@ -392,29 +834,21 @@ class CommunicationMiddleware:
             return False
         
         result = self.shared_blackboard.remove(key)
-        if result:
+        if result and self.record_logs:
             self._log_access("remove", key, None, source)
         return result
     
     def _log_access(self, operation: str, key: str, value: Any, source: str) -> None:
         """Log blackboard access - zero-copy optimized"""
-        log_entry = {
-            "timestamp": time.time(),
-            "operation": operation,
-            "key": key,
-            "value": value,  # Direct reference
-            "source": source
-        }
-        self.access_log.append(log_entry)
-        
-        if len(self.access_log) > self.max_log_size:
-            self.access_log.pop(0)
+        log_entry = AccessLogEntry(_now(), operation, key, value, source)  # Direct value reference
+        self.access_log.append(log_entry)  # Bounded deque, oldest entry dropped
+        self._access_log_by_source[source].append(log_entry)
     
-    def get_access_log(self, source: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get access log - zero-copy optimized"""
+    def get_access_log(self, source: Optional[str] = None) -> Tuple[AccessLogEntry, ...]:
+        """Get access log as an immutable snapshot - zero-copy optimized"""
         if source is None:
-            return self.access_log  # Direct reference
-        return [entry for entry in self.access_log if entry["source"] == source]
+            return tuple(self.access_log)
+        return tuple(self._access_log_by_source.get(source, ()))  # Per-source index
     
     # ==================== State Watching Methods - Zero-Copy Optimized ====================
     
@@ -427,9 +861,7 @@ class CommunicationMiddleware:
             callback: Callback function to execute on state change
             source: Source node name
         """
-        if key not in self.watchers:
-            self.watchers[key] = []
-        self.watchers[key].append(callback)
+        _add_callback(self.watchers, key, callback)
     
     def unwatch_state(self, key: str, callback: Callable) -> bool:
         """
@@ -442,10 +874,7 @@ class CommunicationMiddleware:
         Returns:
             True if callback was found and removed
         """
-        if key in self.watchers and callback in self.watchers[key]:
-            self.watchers[key].remove(callback)
-            return True
-        return False
+        return _remove_callback(self.watchers, key, callback)
     
     async def update_state(self, key: str, value: Any, source: str) -> None:
         """
@@ -459,56 +888,86 @@ class CommunicationMiddleware:
         if not self.enabled:
             return
         
-        old_value = self.state_cache.get(key)
-        self.state_cache[key] = value  # Direct reference storage
+        state_cache = self.state_cache
+        old_value = state_cache.get(key, _MISSING)
+        if old_value is _MISSING:
+            # A new key reads as None before its first write
+            old_value = None
+            if value is None:
+                state_cache[key] = None  # Store the key, but None -> None is no change
+                return
+        elif old_value is value or old_value == value:
+            # Unchanged: nothing to store, record or notify
+            return
+        state_cache[key] = value  # Direct reference storage
         
         # Record state history with direct references
-        if key not in self.state_history:
-            self.state_history[key] = []
-        
-        history_entry = {
-            "timestamp": time.time(),
-            "old_value": old_value,  # Direct reference
-            "new_value": value,  # Direct reference
-            "source": source
-        }
-        self.state_history[key].append(history_entry)
-        
-        # Trim history if needed
-        if len(self.state_history[key]) > self.max_history_per_key:
-            self.state_history[key].pop(0)
-        
-        # Notify watchers if value changed - with direct references
-        if old_value != value and key in self.watchers:
-            tasks = []
-            for callback in self.watchers[key]:
-                if asyncio.iscoroutinefunction(callback):
-                    task = asyncio.create_task(callback(key, old_value, value, source))
-                else:
-                    task = asyncio.create_task(self._run_sync_state_callback(callback, key, old_value, value, source))
-                tasks.append(task)
-            
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+        if self.record_logs:
+            history = self.state_history.get(key)
+            if history is None:
+                history = self.state_history[key] = deque(maxlen=self.max_history_per_key)
+            history.append(StateHistoryEntry(_now(), old_value, value, source))  # Oldest entry dropped
+        
+        # Notify watchers of the change - with direct references
+        callbacks = self.watchers.get(key)
+        if callbacks:
+            await self._dispatch_callbacks(
+                callbacks, (key, old_value, value, source), "State watching callback error"
+            )
     
-    async def _run_sync_state_callback(self, callback: Callable, key: str, old_value: Any, new_value: Any, source: str) -> None:
-        """Run synchronous state callback in async context - zero-copy optimized"""
-        try:
-            callback(key, old_value, new_value, source)  # Direct references
-        except Exception as e:
-            print(f"State watching callback error: {e}")
+    def bind_state_setter(self, key: str, source: str) -> Callable[[Any], Awaitable[None]]:
+        """
+        Bind a state setter to one key and source - zero-copy optimized
+        
+        The returned coroutine function takes only the new value and behaves
+        like update_state(key, value, source), with the key's watcher list
+        resolved once instead of on every call.
+        
+        Args:
+            key: State key
+            source: Source node name
+            
+        Returns:
+            Coroutine function storing its value argument under the key
+        """
+        state_cache = self.state_cache
+        state_history = self.state_history
+        watchers = self.watchers[key]  # Mutated in place by watch/unwatch
+        dispatch = self._dispatch_callbacks
+        
+        async def update_bound(value: Any) -> None:
+            if not self.enabled:
+                return
+            old_value = state_cache.get(key, _MISSING)
+            if old_value is _MISSING:
+                old_value = None
+                if value is None:
+                    state_cache[key] = None
+                    return
+            elif old_value is value or old_value == value:
+                return
+            state_cache[key] = value
+            if self.record_logs:
+                history = state_history.get(key)
+                if history is None:
+                    history = state_history[key] = deque(maxlen=self.max_history_per_key)
+                history.append(StateHistoryEntry(_now(), old_value, value, source))
+            if watchers:
+                await dispatch(watchers, (key, old_value, value, source), "State watching callback error")
+        
+        return update_bound
     
     def get_state(self, key: str) -> Any:
         """Get current state value - zero-copy optimized"""
         return self.state_cache.get(key)  # Direct reference
     
-    def get_state_history(self, key: str) -> List[Dict[str, Any]]:
-        """Get state change history - zero-copy optimized"""
-        return self.state_history.get(key, [])  # Direct reference
+    def get_state_history(self, key: str) -> Tuple[StateHistoryEntry, ...]:
+        """Get state change history as an immutable snapshot - zero-copy optimized"""
+        return tuple(self.state_history.get(key, ()))
     
     def get_watched_keys(self) -> List[str]:
         """Get list of watched state keys - zero-copy optimized"""
-        return list(self.watchers.keys())
+        return _registered_keys(self.watchers)
     
     # ==================== Behavior Call Methods - Zero-Copy Optimized ====================
     
@@ -520,7 +979,7 @@ class CommunicationMiddleware:
             behavior_name: Name of the behavior
             behavior_func: Behavior function to register
         """
-        self.registered_behaviors[behavior_name] = behavior_func
+        self.registered_behaviors[behavior_name] = (behavior_func, asyncio.iscoroutinefunction(behavior_func))
     
     def unregister_behavior(self, behavior_name: str) -> bool:
         """
@@ -549,50 +1008,48 @@ class CommunicationMiddleware:
         Returns:
             Result from the behavior execution
         """
-        if not self.enabled or behavior_name not in self.registered_behaviors:
+        behavior = self.registered_behaviors.get(behavior_name)
+        if not self.enabled or behavior is None:
             raise ValueError(f"Behavior '{behavior_name}' not found")
         
-        behavior_func = self.registered_behaviors[behavior_name]
+        behavior_func, is_coroutine = behavior
         
         # Log the call with direct references
-        call_entry = {
-            "timestamp": time.time(),
-            "behavior": behavior_name,
-            "params": params,  # Direct reference
-            "source": source
-        }
-        self.call_log.append(call_entry)
-        
-        if len(self.call_log) > self.max_log_size:
-            self.call_log.pop(0)
+        call_entry = None
+        if self.record_logs:
+            call_entry = CallLogEntry(_now(), behavior_name, params, source)  # Direct params reference
+            self.call_log.append(call_entry)  # Bounded deque, oldest entry dropped
+            self._call_log_by_behavior[behavior_name].append(call_entry)
         
         try:
-            if asyncio.iscoroutinefunction(behavior_func):
+            if is_coroutine:
                 result = await behavior_func(params)  # Direct params reference
             else:
                 result = behavior_func(params)  # Direct params reference
             
             # Log successful result with direct reference
-            call_entry["result"] = result  # Direct reference
-            call_entry["success"] = True
+            if call_entry is not None:
+                call_entry.result = result  # Direct reference
+                call_entry.success = True
             return result
             
         except Exception as e:
             # Log error
-            call_entry["error"] = str(e)
-            call_entry["success"] = False
-            print(f"Behavior call '{behavior_name}' error: {e}")
+            if call_entry is not None:
+                call_entry.error = str(e)
+                call_entry.success = False
+            _logger.exception("Behavior call %r error", behavior_name)
             raise
     
     def get_registered_behaviors(self) -> List[str]:
         """Get list of registered behaviors - zero-copy optimized"""
         return list(self.registered_behaviors.keys())
     
-    def get_call_log(self, behavior_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get behavior call log - zero-copy optimized"""
+    def get_call_log(self, behavior_name: Optional[str] = None) -> Tuple[CallLogEntry, ...]:
+        """Get behavior call log as an immutable snapshot - zero-copy optimized"""
         if behavior_name is None:
-            return self.call_log  # Direct reference
-        return [entry for entry in self.call_log if entry["behavior"] == behavior_name]
+            return tuple(self.call_log)
+        return tuple(self._call_log_by_behavior.get(behavior_name, ()))  # Per-behavior index
     
     # ==================== Task Board Methods - Zero-Copy Optimized ====================
     
@@ -604,7 +1061,7 @@ class CommunicationMiddleware:
         Args:
             title: Task title
             description: Task description
-            requirements: Set of required capabilities (passed by reference)
+            requirements: Set of required capabilities (stored as a frozenset)
             priority: Task priority (higher = more important)
             data: Additional task data (passed by reference)
             
@@ -617,20 +1074,27 @@ class CommunicationMiddleware:
         self.task_counter += 1
         task_id = f"task_{self.task_counter}"
         
+        # Tasks with equal requirements share one frozenset, so per-set
+        # results can be looked up by identity in get_available_tasks
+        frozen = frozenset(requirements)
+        frozen = self._requirement_sets.setdefault(frozen, frozen)
+        
         # Create task with direct references (no copying)
         task = Task(
             id=task_id,
             title=title,
             description=description,
-            requirements=requirements,  # Direct reference
+            requirements=frozen,  # Requirements never change after publish
             priority=priority,
             data=data or {}  # Direct reference
         )
         
         self.tasks[task_id] = task
+        self._status_counts["pending"] += 1
+        bisect.insort(self._pending_order, (-priority, self.task_counter, task_id))
         
         # Notify potential claimants
-        self._notify_task_available(task)
+        self._notify_task_event("task_available", task)
         
         return task_id
     
@@ -646,23 +1110,27 @@ class CommunicationMiddleware:
         Returns:
             True if task was successfully claimed
         """
-        if not self.enabled or task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if not self.enabled or task is None:
             return False
         
-        task = self.tasks[task_id]
-        
         # Check if task is available and claimant has required capabilities
-        if (task.status == "pending" and 
-            task.requirements.issubset(capabilities)):  # Direct reference comparison
-            
-            task.status = "claimed"
-            task.claimed_by = claimant
-            
-            # Notify task claimed
-            self._notify_task_claimed(task)
-            return True
+        if (task.status != "pending" or
+                not task.requirements.issubset(_as_set(capabilities))):
+            return False
         
-        return False
+        # Bind the owner before changing status: setdefault is a single atomic
+        # dict operation, so concurrent claimants cannot both win the task
+        if self._claim_owner.setdefault(task_id, claimant) != claimant:
+            return False
+        
+        self._set_task_status(task, "claimed")
+        task.claimed_by = claimant
+        self._claimed_by.setdefault(claimant, {})[task_id] = None
+        
+        # Notify task claimed
+        self._notify_task_event("task_claimed", task)
+        return True
     
     def complete_task(self, task_id: str, result: Any = None) -> bool:
         """
@@ -680,9 +1148,10 @@ class CommunicationMiddleware:
         
         task = self.tasks[task_id]
         if task.status == "claimed":
-            task.status = "completed"
+            self._set_task_status(task, "completed")
+            self._release_claim(task)
             task.data["result"] = result  # Direct reference storage
-            self._notify_task_completed(task)
+            self._notify_task_event("task_completed", task)
             return True
         
         return False
@@ -703,9 +1172,11 @@ class CommunicationMiddleware:
         
         task = self.tasks[task_id]
         if task.status in ["pending", "claimed"]:
-            task.status = "failed"
+            if task.status == "claimed":
+                self._release_claim(task)
+            self._set_task_status(task, "failed")
             task.data["error"] = error
-            self._notify_task_failed(task)
+            self._notify_task_event("task_failed", task)
             return True
         
         return False
@@ -720,65 +1191,115 @@ class CommunicationMiddleware:
         Returns:
             List of available tasks (direct references)
         """
+        tasks = self.tasks
+        order = self._pending_order
+        
+        # Entries are kept sorted by priority (highest first), then publish order
+        capability_set = _as_set(capabilities)  # Convert once, not per task
+        # Boards hold few distinct requirement sets, so check each one once
+        fits: Dict[FrozenSet[str], bool] = {}
         available = []
-        for task in self.tasks.values():
-            if (task.status == "pending" and 
-                task.requirements.issubset(capabilities)):  # Direct reference comparison
+        stale = 0
+        for _, _, task_id in order:
+            task = tasks[task_id]
+            if task.status != "pending":
+                stale += 1
+                continue
+            requirements = task.requirements
+            fit = fits.get(requirements)
+            if fit is None:
+                fit = fits[requirements] = requirements.issubset(capability_set)
+            if fit:
                 available.append(task)  # Direct reference
         
-        # Sort by priority (highest first)
-        available.sort(key=lambda t: t.priority, reverse=True)
+        # Compact once most entries belong to tasks that are no longer pending
+        if stale * 2 > len(order):
+            self._pending_order = [entry for entry in order if tasks[entry[2]].status == "pending"]
         return available
     
     def get_claimed_tasks(self, claimant: str) -> List[Task]:
         """Get tasks claimed by a specific node - zero-copy optimized"""
-        return [task for task in self.tasks.values() 
-                if task.claimed_by == claimant and task.status == "claimed"]  # Direct references
-    
-    def register_claim_callback(self, callback: Callable) -> None:
-        """Register callback for task claiming events - zero-copy optimized"""
-        if "claim_callback" not in self.claim_callbacks:
-            self.claim_callbacks["claim_callback"] = []
-        self.claim_callbacks["claim_callback"].append(callback)
-    
-    def _notify_task_available(self, task: Task) -> None:
-        """Notify that a task is available - zero-copy optimized"""
-        if "task_available" in self.claim_callbacks:
-            for callback in self.claim_callbacks["task_available"]:
-                asyncio.create_task(callback(task))  # Direct task reference
-    
-    def _notify_task_claimed(self, task: Task) -> None:
-        """Notify that a task was claimed - zero-copy optimized"""
-        if "task_claimed" in self.claim_callbacks:
-            for callback in self.claim_callbacks["task_claimed"]:
-                asyncio.create_task(callback(task))  # Direct task reference
-    
-    def _notify_task_completed(self, task: Task) -> None:
-        """Notify that a task was completed - zero-copy optimized"""
-        if "task_completed" in self.claim_callbacks:
-            for callback in self.claim_callbacks["task_completed"]:
-                asyncio.create_task(callback(task))  # Direct task reference
-    
-    def _notify_task_failed(self, task: Task) -> None:
-        """Notify that a task failed - zero-copy optimized"""
-        if "task_failed" in self.claim_callbacks:
-            for callback in self.claim_callbacks["task_failed"]:
-                asyncio.create_task(callback(task))  # Direct task reference
+        tasks = self.tasks
+        return [tasks[task_id] for task_id in self._claimed_by.get(claimant, ())
+                if tasks[task_id].status == "claimed"]  # Direct references
+    
+    def _set_task_status(self, task: Task, status: str) -> None:
+        """Change a task's status and the running status counts together"""
+        counts = self._status_counts
+        counts[task.status] -= 1
+        counts[status] += 1
+        task.status = status
+    
+    def _release_claim(self, task: Task) -> None:
+        """Remove a task from its claimant's index"""
+        claimant = task.claimed_by
+        if claimant is None:
+            return
+        claimed = self._claimed_by.get(claimant)
+        if claimed is not None:
+            claimed.pop(task.id, None)
+            if not claimed:
+                del self._claimed_by[claimant]
+    
+    def register_claim_callback(self, callback: Callable, event: str = "task_claimed") -> None:
+        """
+        Register callback for task board events - zero-copy optimized
+        
+        Args:
+            callback: Function called with the Task. Plain functions are
+                called inline. Coroutine functions are queued and run in
+                notification order on one background task.
+            event: One of "task_available", "task_claimed", "task_completed"
+                or "task_failed" (default "task_claimed")
+        """
+        if event not in TASK_EVENTS:
+            raise ValueError(f"Unknown task event '{event}'")
+        _add_callback(self.claim_callbacks, event, callback)
+    
+    def _notify_task_event(self, event: str, task: Task) -> None:
+        """Notify task board callbacks registered for event - zero-copy optimized"""
+        callbacks = self.claim_callbacks.get(event)
+        if not callbacks:
+            return
+        coroutine_callbacks = []
+        for entry in tuple(callbacks):
+            if entry[1]:
+                coroutine_callbacks.append(entry)
+                continue
+            try:
+                entry[0](task)  # Direct task reference
+            except Exception:
+                _logger.exception("Task %s callback error", event)
+        
+        # Coroutine callbacks are queued; every notification made before the
+        # drain task runs shares that one task
+        if coroutine_callbacks:
+            self._pending_notifications.append((event, coroutine_callbacks, task))
+            if self._notify_task is None:
+                self._notify_task = asyncio.create_task(self._drain_task_notifications())
+    
+    async def _drain_task_notifications(self) -> None:
+        """Run queued async task board callbacks in the order they were notified"""
+        dispatch = self._dispatch_callbacks
+        try:
+            while self._pending_notifications:
+                pending = self._pending_notifications
+                self._pending_notifications = []
+                for event, callbacks, task in pending:
+                    await dispatch(callbacks, (task,), f"Task {event} callback error")
+        finally:
+            self._notify_task = None
     
     def get_task_stats(self) -> Dict[str, Any]:
         """Get task board statistics - zero-copy optimized"""
-        total_tasks = len(self.tasks)
-        pending_tasks = len([t for t in self.tasks.values() if t.status == "pending"])
-        claimed_tasks = len([t for t in self.tasks.values() if t.status == "claimed"])
-        completed_tasks = len([t for t in self.tasks.values() if t.status == "completed"])
-        failed_tasks = len([t for t in self.tasks.values() if t.status == "failed"])
+        status_counts = self._status_counts  # Maintained on every transition
         
         return {
-            "total_tasks": total_tasks,
-            "pending_tasks": pending_tasks,
-            "claimed_tasks": claimed_tasks,
-            "completed_tasks": completed_tasks,
-            "failed_tasks": failed_tasks
+            "total_tasks": len(self.tasks),
+            "pending_tasks": status_counts["pending"],
+            "claimed_tasks": status_counts["claimed"],
+            "completed_tasks": status_counts["completed"],
+            "failed_tasks": status_counts["failed"]
         }
     
     # ==================== Shared EventSystem Methods - Zero-Copy Optimized ====================
@@ -799,14 +1320,14 @@ class CommunicationMiddleware:
             return
         
         # Store shared EventSystem in tree's blackboard
-        if tree.blackboard and hasattr(tree.blackboard, 'set'):
+        if tree.blackboard is not None:
             tree.blackboard.set("__event_dispatcher", self.shared_event_dispatcher)
         
         # Set tree's event_dispatcher to shared one
         tree.event_dispatcher = self.shared_event_dispatcher
-        self.event_dispatcher_nodes[node_name] = "__event_dispatcher"
+        self.event_dispatcher_nodes.add(node_name)
         
-        print(f"🔗 Added tree '{node_name}' to shared EventSystem")
+        _logger.debug("Added tree %r to shared EventSystem", node_name)
     
     def remove_tree_from_shared_event_dispatcher(self, node_name: str) -> bool:
         """
@@ -819,14 +1340,14 @@ class CommunicationMiddleware:
             True if tree was found and removed
         """
         if node_name in self.event_dispatcher_nodes:
-            del self.event_dispatcher_nodes[node_name]
-            print(f"🔗 Removed tree '{node_name}' from shared EventSystem")
+            self.event_dispatcher_nodes.discard(node_name)
+            _logger.debug("Removed tree %r from shared EventSystem", node_name)
             return True
         return False
     
-    def get_trees_with_shared_event_dispatcher(self) -> List[str]:
-        """Get list of trees using shared EventSystem - zero-copy optimized"""
-        return list(self.event_dispatcher_nodes.keys())
+    def get_trees_with_shared_event_dispatcher(self) -> Tuple[str, ...]:
+        """Get names of trees using shared EventSystem - zero-copy optimized"""
+        return tuple(self.event_dispatcher_nodes)
     
     def emit_shared_event(self, event_name: str, source: str, data: Any = None) -> None:
         """
@@ -840,28 +1361,14 @@ class CommunicationMiddleware:
         if not self.enabled:
             return
         
-        # Use asyncio.create_task but also trigger the event immediately
-        try:
-            asyncio.create_task(
-                self.shared_event_dispatcher.emit(event_name, source=source, data=data)
-            )
-        except RuntimeError:
-            # If no event loop is running, try to emit synchronously
-            import asyncio as asyncio_module
-            loop = asyncio_module.new_event_loop()
-            asyncio_module.set_event_loop(loop)
-            try:
-                loop.run_until_complete(
-                    self.shared_event_dispatcher.emit(event_name, source=source, data=data)
-                )
-            finally:
-                loop.close()
+        # Trigger the event immediately, with or without a running event loop
+        self.shared_event_dispatcher.emit_nowait(event_name, source=source, data=data)
     
     def get_shared_event_dispatcher_stats(self) -> Dict[str, Any]:
         """Get shared EventSystem statistics - zero-copy optimized"""
         return {
             "shared_trees": len(self.event_dispatcher_nodes),
-            "tree_names": list(self.event_dispatcher_nodes.keys()),
+            "tree_names": list(self.event_dispatcher_nodes),
             "event_dispatcher_stats": self.shared_event_dispatcher.get_stats()
         }
     
@@ -875,9 +1382,7 @@ class CommunicationMiddleware:
             topic: Topic for external publishing
             callback: Callback function to execute when data is published externally
         """
-        if topic not in self.out_publishers:
-            self.out_publishers[topic] = []
-        self.out_publishers[topic].append(callback)
+        _add_callback(self.out_publishers, topic, callback)
     
     def unregister_publisher(self, topic: str, callback: Callable) -> bool:
         """
@@ -890,10 +1395,7 @@ class CommunicationMiddleware:
         Returns:
             True if callback was found and removed
         """
-        if topic in self.out_publishers and callback in self.out_publishers[topic]:
-            self.out_publishers[topic].remove(callback)
-            return True
-        return False
+        return _remove_callback(self.out_publishers, topic, callback)
     
     async def publish_to_external(self, topic: str, data: Any, source: str) -> None:
         """
@@ -908,32 +1410,12 @@ class CommunicationMiddleware:
             return
         
         # Create external publish info with direct reference to data (no copying)
-        publish_info = {
-            "topic": topic,
-            "data": data,
-            "source": source,
-            "timestamp": time.time()
-        }
+        publish_info = TopicEvent(topic, data, source, _now())
         
         # Execute external publisher callbacks with direct data reference
-        if topic in self.out_publishers:
-            tasks = []
-            for callback in self.out_publishers[topic]:
-                if asyncio.iscoroutinefunction(callback):
-                    task = asyncio.create_task(callback(publish_info))
-                else:
-                    task = asyncio.create_task(self._run_sync_external_callback(callback, publish_info))
-                tasks.append(task)
-            
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
-    
-    async def _run_sync_external_callback(self, callback: Callable, publish_info: Dict[str, Any]) -> None:
-        """Run synchronous external callback in async context - zero-copy optimized"""
-        try:
-            callback(publish_info)  # Direct publish_info reference
-        except Exception as e:
-            print(f"External publisher callback error: {e}")
+        publishers = self.out_publishers.get(topic)
+        if publishers:
+            await self._dispatch_callbacks(publishers, (publish_info,), "External publisher callback error")
     
     def register_subscriber(self, topic: str, callback: Callable) -> None:
         """
@@ -943,9 +1425,7 @@ class CommunicationMiddleware:
             topic: Topic for external subscription
             callback: Callback function to execute when external data is received
         """
-        if topic not in self.in_subscribers:
-            self.in_subscribers[topic] = []
-        self.in_subscribers[topic].append(callback)
+        _add_callback(self.in_subscribers, topic, callback)
     
     def unregister_external_subscriber(self, topic: str, callback: Callable) -> bool:
         """
@@ -958,10 +1438,7 @@ class CommunicationMiddleware:
         Returns:
             True if callback was found and removed
         """
-        if topic in self.in_subscribers and callback in self.in_subscribers[topic]:
-            self.in_subscribers[topic].remove(callback)
-            return True
-        return False
+        return _remove_callback(self.in_subscribers, topic, callback)
     
     async def subscribe_external(self, topic: str, data: Any, source: str = "external") -> None:
         """
@@ -976,66 +1453,46 @@ class CommunicationMiddleware:
             return
         
         # Create external subscription info with direct reference to data (no copying)
-        subscription_info = {
-            "topic": topic,
-            "data": data,
-            "source": source,
-            "timestamp": time.time()
-        }
+        subscription_info = TopicEvent(topic, data, source, _now())
         
-        # Add to external data queue for processing
+        # Add to external data queue for processing (bounded, oldest entry dropped)
         self.incoming_queue.append(subscription_info)
-        
-        # Trim queue if needed
-        if len(self.incoming_queue) > self.max_incoming_queue_size:
-            self.incoming_queue.pop(0)
+        self._incoming_by_topic[topic].append(subscription_info)
         
         # Execute external subscriber callbacks with direct data reference
-        if topic in self.in_subscribers:
-            tasks = []
-            for callback in self.in_subscribers[topic]:
-                if asyncio.iscoroutinefunction(callback):
-                    task = asyncio.create_task(callback(subscription_info))
-                else:
-                    task = asyncio.create_task(self._run_sync_external_sub_callback(callback, subscription_info))
-                tasks.append(task)
-            
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
-    
-    async def _run_sync_external_sub_callback(self, callback: Callable, subscription_info: Dict[str, Any]) -> None:
-        """Run synchronous external subscriber callback in async context - zero-copy optimized"""
-        try:
-            callback(subscription_info)  # Direct subscription_info reference
-        except Exception as e:
-            print(f"External subscriber callback error: {e}")
+        await self._run_handlers(self.in_subscribers, "External subscriber callback", topic, subscription_info)
     
-    def get_incoming_queue(self, topic: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_incoming_queue(self, topic: Optional[str] = None) -> Sequence[TopicEvent]:
         """Get incoming data queue - zero-copy optimized"""
         if topic is None:
             return self.incoming_queue  # Direct reference
-        return [entry for entry in self.incoming_queue if entry["topic"] == topic]
+        if self.async_queues:
+            return [entry for entry in self.incoming_queue if entry.topic == topic]
+        return list(self._incoming_by_topic.get(topic, ()))  # Per-topic index
     
-    def get_out_publishers(self, topic: str) -> List[Callable]:
+    def get_out_publishers(self, topic: str) -> Tuple[Callable, ...]:
         """Get out publishers for a topic - zero-copy optimized"""
-        return self.out_publishers.get(topic, [])
+        return tuple(callback for callback, _ in self.out_publishers.get(topic, ()))
     
-    def get_in_subscribers(self, topic: str) -> List[Callable]:
+    def get_in_subscribers(self, topic: str) -> Tuple[Callable, ...]:
         """Get in subscribers for a topic - zero-copy optimized"""
-        return self.in_subscribers.get(topic, [])
+        return tuple(callback for callback, _ in self.in_subscribers.get(topic, ()))
     
     def clear_incoming_queue(self) -> None:
         """Clear incoming data queue - zero-copy optimized"""
         self.incoming_queue.clear()
+        self._incoming_by_topic.clear()
     
     def get_external_communication_stats(self) -> Dict[str, Any]:
         """Get external communication statistics - zero-copy optimized"""
+        publisher_topics = _registered_keys(self.out_publishers)
+        subscriber_topics = _registered_keys(self.in_subscribers)
         return {
-            "out_publishers": len(self.out_publishers),
-            "in_subscribers": len(self.in_subscribers),
+            "out_publishers": len(publisher_topics),
+            "in_subscribers": len(subscriber_topics),
             "incoming_queue_size": len(self.incoming_queue),
-            "publisher_topics": list(self.out_publishers.keys()),
-            "subscriber_topics": list(self.in_subscribers.keys())
+            "publisher_topics": publisher_topics,
+            "subscriber_topics": subscriber_topics
         }
     
     # ==================== ExternalIO Methods - Zero-Copy Optimized ====================
@@ -1048,9 +1505,7 @@ class CommunicationMiddleware:
             channel: Input channel name
             handler: Handler function to process incoming data
         """
-        if channel not in self.external_input_handlers:
-            self.external_input_handlers[channel] = []
-        self.external_input_handlers[channel].append(handler)
+        _add_callback(self.external_input_handlers, channel, handler)
     
     def unregister_input_handler(self, channel: str, handler: Callable) -> bool:
         """
@@ -1063,10 +1518,7 @@ class CommunicationMiddleware:
         Returns:
             True if handler was found and removed
         """
-        if channel in self.external_input_handlers and handler in self.external_input_handlers[channel]:
-            self.external_input_handlers[channel].remove(handler)
-            return True
-        return False
+        return _remove_callback(self.external_input_handlers, channel, handler)
     
     def register_output_handler(self, channel: str, handler: Callable) -> None:
         """
@@ -1076,9 +1528,7 @@ class CommunicationMiddleware:
             channel: Output channel name
             handler: Handler function to process outgoing data
         """
-        if channel not in self.external_output_handlers:
-            self.external_output_handlers[channel] = []
-        self.external_output_handlers[channel].append(handler)
+        _add_callback(self.external_output_handlers, channel, handler)
     
     def unregister_output_handler(self, channel: str, handler: Callable) -> bool:
         """
@@ -1091,10 +1541,7 @@ class CommunicationMiddleware:
         Returns:
             True if handler was found and removed
         """
-        if channel in self.external_output_handlers and handler in self.external_output_handlers[channel]:
-            self.external_output_handlers[channel].remove(handler)
-            return True
-        return False
+        return _remove_callback(self.external_output_handlers, channel, handler)
     
     async def external_input(self, channel: str, data: Any) -> None:
         """
@@ -1105,43 +1552,37 @@ class CommunicationMiddleware:
             data: Input data (passed by reference, no copying)
         """
         if not self.enabled:
-            print(f"Warning: Communication middleware is disabled, skipping external input for channel '{channel}'")
+            _logger.warning("Communication middleware is disabled, skipping external input for channel %r", channel)
             return
         
-        print(f"Processing external input for channel '{channel}' with data: {data}")
+        _logger.debug("Processing external input for channel %r with data: %r", channel, data)
         
         # Create input info with direct reference to data (no copying)
-        input_info = {
-            "channel": channel,
-            "data": data,
-            "source": "external",
-            "timestamp": time.time()
-        }
+        input_info = ChannelEvent(channel, data, "external", _now())
         
         # Add to input queue for processing
-        self.input_queue.append(input_info)
+        self.input_queue.append(input_info)  # Bounded queue, oldest entry dropped
+        self._input_by_channel[channel].append(input_info)
         
-        # Trim queue if needed
-        if len(self.input_queue) > self.max_io_queue_size:
-            self.input_queue.pop(0)
+        # Emit event to forest's event dispatcher for CommExternalInput nodes (separate from on_input).
+        # Queued before the handlers run, so the emit overlaps with them instead of waiting
+        if self.forest and hasattr(self.forest, 'forest_event_dispatcher'):
+            # Coalesced with the other inputs of this loop iteration into one emit_many
+            self._pending_forest_emits.append((self._input_event_name(channel), data))
+            if not self._forest_emit_scheduled:
+                self._forest_emit_scheduled = True
+                asyncio.get_running_loop().call_soon(self._schedule_forest_emits)
+            _logger.debug("External input event queued for channel %r", channel)
         
         # Execute on_input handlers (for external system callbacks only)
-        if channel in self.external_input_handlers:
-            tasks = []
-            for handler in self.external_input_handlers[channel]:
-                if asyncio.iscoroutinefunction(handler):
-                    task = asyncio.create_task(handler(input_info))
-                else:
-                    task = asyncio.create_task(self._run_sync_input_handler(handler, input_info))
-                tasks.append(task)
-            
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Emit event to forest's event dispatcher for CommExternalInput nodes (separate from on_input)
-        if self.forest and hasattr(self.forest, 'forest_event_dispatcher'):
-            await self.forest.forest_event_dispatcher.emit(f"external_input_{channel}", source="external", data=data)
-            print(f"External input event emitted for channel '{channel}'")
+        await self._run_handlers(self.external_input_handlers, "External input handler", channel, input_info)
+    
+    def _input_event_name(self, channel: str) -> str:
+        """Return the forest event name for an input channel, built and interned once"""
+        name = self._input_event_names.get(channel)
+        if name is None:
+            name = self._input_event_names[channel] = sys.intern(f"external_input_{channel}")
+        return name
     
     async def external_output(self, channel: str, data: Any) -> None:
         """
@@ -1155,74 +1596,50 @@ class CommunicationMiddleware:
             return
         
         # Create output info with direct reference to data (no copying)
-        output_info = {
-            "channel": channel,
-            "data": data,
-            "source": "internal",
-            "timestamp": time.time()
-        }
+        output_info = ChannelEvent(channel, data, "internal", _now())
         
         # Add to output queue for processing
-        self.output_queue.append(output_info)
-        
-        # Trim queue if needed
-        if len(self.output_queue) > self.max_io_queue_size:
-            self.output_queue.pop(0)
+        self.output_queue.append(output_info)  # Bounded queue, oldest entry dropped
+        self._output_by_channel[channel].append(output_info)
         
         # Execute output handlers with direct data reference
-        if channel in self.external_output_handlers:
-            tasks = []
-            for handler in self.external_output_handlers[channel]:
-                if asyncio.iscoroutinefunction(handler):
-                    task = asyncio.create_task(handler(output_info))
-                else:
-                    task = asyncio.create_task(self._run_sync_output_handler(handler, output_info))
-                tasks.append(task)
-            
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
-    
-    async def _run_sync_input_handler(self, handler: Callable, input_info: Dict[str, Any]) -> None:
-        """Run synchronous input handler in async context - zero-copy optimized"""
-        try:
-            handler(input_info)  # Direct input_info reference
-        except Exception as e:
-            print(f"External input handler error: {e}")
-    
-    async def _run_sync_output_handler(self, handler: Callable, output_info: Dict[str, Any]) -> None:
-        """Run synchronous output handler in async context - zero-copy optimized"""
-        try:
-            handler(output_info)  # Direct output_info reference
-        except Exception as e:
-            print(f"External output handler error: {e}")
+        await self._run_handlers(self.external_output_handlers, "External output handler", channel, output_info)
     
-    def get_input_queue(self, channel: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_input_queue(self, channel: Optional[str] = None) -> Sequence[ChannelEvent]:
         """Get input data queue - zero-copy optimized"""
         if channel is None:
             return self.input_queue  # Direct reference
-        return [entry for entry in self.input_queue if entry["channel"] == channel]
+        if self.async_queues:
+            return [entry for entry in self.input_queue if entry.channel == channel]
+        return list(self._input_by_channel.get(channel, ()))  # Per-channel index
     
-    def get_output_queue(self, channel: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_output_queue(self, channel: Optional[str] = None) -> Sequence[ChannelEvent]:
         """Get output data queue - zero-copy optimized"""
         if channel is None:
             return self.output_queue  # Direct reference
-        return [entry for entry in self.output_queue if entry["channel"] == channel]
+        if self.async_queues:
+            return [entry for entry in self.output_queue if entry.channel == channel]
+        return list(self._output_by_channel.get(channel, ()))  # Per-channel index
     
     def clear_input_queue(self) -> None:
         """Clear input data queue - zero-copy optimized"""
         self.input_queue.clear()
+        self._input_by_channel.clear()
     
     def clear_output_queue(self) -> None:
         """Clear output data queue - zero-copy optimized"""
         self.output_queue.clear()
+        self._output_by_channel.clear()
     
     def get_external_io_stats(self) -> Dict[str, Any]:
         """Get external IO statistics - zero-copy optimized"""
+        input_channels = _registered_keys(self.external_input_handlers)
+        output_channels = _registered_keys(self.external_output_handlers)
         return {
-            "input_handlers": len(self.external_input_handlers),
-            "output_handlers": len(self.external_output_handlers),
+            "input_handlers": len(input_channels),
+            "output_handlers": len(output_channels),
             "input_queue_size": len(self.input_queue),
             "output_queue_size": len(self.output_queue),
-            "input_channels": list(self.external_input_handlers.keys()),
-            "output_channels": list(self.external_output_handlers.keys())
+            "input_channels": input_channels,
+            "output_channels": output_channels
         } 
\ No newline at end of file
@@ -6,6 +6,7 @@ and ForestNode that enable multiple behavior trees to work together.
 """
 
 import asyncio
+import inspect
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Callable, Dict, List, Optional, Set, Union
@@ -15,6 +16,7 @@ from ..core.status import Status
 from ..engine.behavior_tree import BehaviorTree
 from ..engine.blackboard import Blackboard
 from ..engine.event import EventDispatcher
+from ..engine.tick_manager import TickScheduler
 
 
 class ForestNodeType(Enum):
@@ -129,6 +131,7 @@ class BehaviorForest:
         forest_event_dispatcher: Forest-level event dispatcher
         running: Whether the forest is running
         _task: Forest execution task
+        _tick_scheduler: Shared scheduler that batches the trees' periodic ticks
     """
     
     def __init__(
@@ -152,6 +155,8 @@ class BehaviorForest:
         self.forest_event_dispatcher = forest_event_dispatcher or EventDispatcher()
         self.running = False
         self._task: Optional[asyncio.Task] = None
+        # Single scheduler driving every tree's tick manager
+        self._tick_scheduler = TickScheduler()
         # Track running tasks for each node to prevent duplicate task creation
         self._node_tasks: Dict[str, Optional[asyncio.Task]] = {}
         # Track execution states to prevent race conditions
@@ -428,9 +433,14 @@ class BehaviorForest:
         # Start each behavior tree's tick manager
         for node_name, node in self.nodes.items():
             try:
-                if node.tree.tick_manager:
+                tick_manager = node.tree.tick_manager
+                if tick_manager:
+                    # Batch this tree's ticks with the rest of the forest, unless
+                    # it asked for pacing the shared scheduler does not provide
+                    if not (tick_manager.timer_thread or tick_manager.high_precision):
+                        tick_manager.scheduler = self._tick_scheduler
                     # Get the tick rate from the tick manager
-                    tick_rate = node.tree.tick_manager.tick_rate
+                    tick_rate = tick_manager.tick_rate
                     await node.tree.start(tick_rate=tick_rate)
                     print(f"🌳 Started behavior tree: {node_name} (tick_rate: {tick_rate})")
             except Exception as e:
@@ -461,6 +471,8 @@ class BehaviorForest:
             except Exception as e:
                 print(f"❌ Failed to stop behavior tree {node_name}: {e}")
         
+        await self._tick_scheduler.close()
+        
         # Cancel all running node tasks
         for node_name, task in self._node_tasks.items():
             if task and not task.done():
@@ -483,6 +495,13 @@ class BehaviorForest:
                 pass
             self._task = None
         
+        # Let middleware release background tasks; close() may be sync or async
+        for middleware in self.middleware:
+            if hasattr(middleware, 'close'):
+                closing = middleware.close()
+                if inspect.isawaitable(closing):
+                    await closing
+        
         # Emit forest stop event
         await self.forest_event_dispatcher.emit(
             "forest_stopped",
@@ -3,38 +3,12 @@ Forest Extensions - Advanced features for behavior forests
 
 This module contains advanced features including performance
 monitoring and plugin system for behavior forests.
+
+The names are resolved by the parent ``abtree.forest`` package, which imports
+the underlying modules lazily, so both import paths share one implementation.
 """
 
-from typing import Any
-
-# Import extension classes from forest module
-try:
-    from ..plugin_system import (
-        BasePlugin,
-        PluginInfo,
-        PluginManager,
-        create_plugin_manager,
-    )
-    PLUGIN_SYSTEM_AVAILABLE = True
-except ImportError:
-    PLUGIN_SYSTEM_AVAILABLE = False
-    PluginManager: Any = None  # type: ignore[no-redef]
-    BasePlugin: Any = None  # type: ignore[no-redef]
-    PluginInfo: Any = None  # type: ignore[no-redef]
-    create_plugin_manager: Any = None  # type: ignore[no-redef]
-
-try:
-    from ..performance import (
-        PerformanceMonitor,
-        create_performance_monitor,
-        monitor_forest_performance,
-    )
-    PERFORMANCE_MONITORING_AVAILABLE = True
-except ImportError:
-    PERFORMANCE_MONITORING_AVAILABLE = False
-    PerformanceMonitor: Any = None  # type: ignore[no-redef]
-    create_performance_monitor: Any = None  # type: ignore[no-redef]
-    monitor_forest_performance: Any = None  # type: ignore[no-redef]
+from typing import Any, List
 
 __all__ = [
     # Plugin system
@@ -42,13 +16,30 @@ __all__ = [
     "BasePlugin",
     "PluginInfo",
     "create_plugin_manager",
-    
+
     # Performance monitoring
     "PerformanceMonitor",
     "create_performance_monitor",
     "monitor_forest_performance",
-    
+
     # Availability flags
     "PLUGIN_SYSTEM_AVAILABLE",
     "PERFORMANCE_MONITORING_AVAILABLE",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve extension names through the parent forest package"""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from ... import forest as forest_package
+
+    value = getattr(forest_package, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily resolved names in dir()"""
+    return sorted(set(globals()) | set(__all__))
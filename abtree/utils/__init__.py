@@ -4,6 +4,7 @@ Utility Module - Common tools and auxiliary functions
 Provides logging, validation, debugging and other common utility functions.
 """
 
+from .event_loop import fast_event_loop_available, install_fast_event_loop
 from .logger import (
     ABTreeLogger,
     ColorCode,
@@ -22,4 +23,6 @@ __all__ = [
     "ColorCode",
     "LevelColor",
     "ColoredFormatter",
+    "fast_event_loop_available",
+    "install_fast_event_loop",
 ]
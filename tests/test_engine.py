@@ -3,7 +3,7 @@ import asyncio
 from abtree.engine.behavior_tree import BehaviorTree
 from abtree.engine.blackboard import Blackboard
 from abtree.engine.event import EventDispatcher
-from abtree.engine.tick_manager import TickManager
+from abtree.engine.tick_manager import TickManager, TickScheduler
 from abtree.core.status import Status
 from abtree.nodes.base import BaseNode
 
@@ -114,6 +114,19 @@ async def test_event_dispatcher_advanced():
     assert info1.source == 'source1'
     assert info2.source == 'source2'
 
+@pytest.mark.asyncio
+async def test_event_dispatcher_emit_many():
+    es = EventDispatcher()
+    
+    await es.emit_many([('event1', 1), ('event2', 2), ('event1', 3)], source='batch')
+    assert await es.wait_for_all(['event1', 'event2'], timeout=1.0)
+    
+    info1 = es.get_event_info('event1')
+    assert info1.data == 3
+    assert info1.trigger_count == 2
+    assert info1.source == 'batch'
+    assert es.get_event_info('event2').data == 2
+
 @pytest.mark.asyncio
 async def test_event_dispatcher_global_listeners():
     es = EventDispatcher()
@@ -250,6 +263,43 @@ async def test_tick_manager_with_callbacks():
     assert tick_called
     assert status_changed
 
+@pytest.mark.asyncio
+async def test_tick_manager_callback_set_after_ticks():
+    tm = TickManager()
+    tm.set_root_node(DummyNode(name='root'))
+    
+    # No callbacks: tick still records the status
+    assert await tm.tick_once() == Status.SUCCESS
+    assert tm.get_last_status() == Status.SUCCESS
+    
+    ticks = []
+    tm.set_on_tick_callback(ticks.append)
+    await tm.tick_once()
+    assert ticks == [Status.SUCCESS]
+
+@pytest.mark.asyncio
+async def test_tick_manager_callback_field_assignment():
+    tm = TickManager()
+    tm.set_root_node(DummyNode(name='root'))
+    
+    # Assigning the public fields works like the setters
+    ticks = []
+    changes = []
+    tm.on_tick = ticks.append
+    tm.on_status_change = lambda old, new: changes.append(new)
+    await tm.tick_once()
+    assert ticks == [Status.SUCCESS]
+    assert changes == [Status.SUCCESS]
+    
+    assert tm._tick == tm._tick_once_validated
+    
+    tm.on_tick = None
+    tm.on_status_change = None
+    await tm.tick_once()
+    assert ticks == [Status.SUCCESS]
+    assert tm._tick == tm._tick_once_quiet
+    assert TickManager(on_tick=ticks.append).on_tick == ticks.append
+
 def test_tick_manager_configuration():
     tm = TickManager(tick_rate=30.0)
     assert tm.tick_rate == 30.0
@@ -261,6 +311,17 @@ def test_tick_manager_configuration():
     assert 'tick_count' in stats
     assert 'running' in stats
 
+@pytest.mark.asyncio
+async def test_tick_manager_last_tick_time_is_wall_clock():
+    import time
+    tm = TickManager()
+    tm.set_root_node(DummyNode(name='root'))
+    
+    assert tm.get_last_tick_time() == 0.0
+    await tm.tick_once()
+    assert abs(tm.get_last_tick_time() - time.time()) < 1.0
+    assert tm.get_stats()['last_tick_time'] > 0.0
+
 @pytest.mark.asyncio
 async def test_tick_manager_start_stop():
     tm = TickManager()
@@ -278,6 +339,224 @@ async def test_tick_manager_start_stop():
     
     assert not tm.running
 
+@pytest.mark.asyncio
+async def test_tick_manager_keeps_tick_rate(monkeypatch):
+    import abtree.engine.tick_manager as tick_manager_module
+    
+    # Wake-ups return at once, so the loop runs ahead of the real clock and
+    # every wait target comes from the deadline arithmetic alone
+    wake_targets = []
+    
+    async def instant_sleep_until(loop, when):
+        wake_targets.append(when)
+        await asyncio.sleep(0)
+    
+    monkeypatch.setattr(tick_manager_module, "_sleep_until", instant_sleep_until)
+    
+    tm = TickManager(tick_rate=100.0)
+    tm.set_root_node(DummyNode(name='root'))
+    
+    await tm.start()
+    while len(wake_targets) < 20:
+        await asyncio.sleep(0)
+    await tm.stop()
+    
+    # Deadlines are absolute: each wait ends exactly one interval after the
+    # previous one, however long the tick itself took
+    interval = 1.0 / tm.tick_rate
+    for previous, current in zip(wake_targets, wake_targets[1:20]):
+        assert current - previous == pytest.approx(interval, abs=1e-9)
+
+@pytest.mark.asyncio
+async def test_tick_manager_throttles_error_logging(caplog):
+    tm = TickManager(tick_rate=200.0)
+    
+    with caplog.at_level("ERROR", logger="abtree.engine.tick_manager"):
+        for _ in range(20):
+            tm._report_tick_error(RuntimeError("boom"))
+    
+    # Only the 1st, 2nd, 4th, 8th and 16th errors are logged
+    assert tm.get_stats()['error_count'] == 20
+    assert [record.args[0] for record in caplog.records] == [1, 2, 4, 8, 16]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("high_precision", [True, False])
+async def test_tick_manager_high_precision(monkeypatch, high_precision):
+    import abtree.engine.tick_manager as tick_manager_module
+    
+    timer_sleeps = []
+    real_sleep_until = tick_manager_module._sleep_until
+    
+    async def recording_sleep_until(loop, when):
+        timer_sleeps.append(when)
+        await real_sleep_until(loop, when)
+    
+    monkeypatch.setattr(tick_manager_module, "_sleep_until", recording_sleep_until)
+    
+    loop = asyncio.get_running_loop()
+    tick_times = []
+    tm = TickManager(tick_rate=1000.0, high_precision=high_precision)
+    tm.set_root_node(DummyNode(name='root'))
+    tm.set_on_tick_callback(lambda status: tick_times.append(loop.time()))
+    
+    await tm.start()
+    for _ in range(2000):
+        if len(tick_times) >= 20:
+            break
+        await asyncio.sleep(0.005)
+    await tm.stop()
+    
+    assert len(tick_times) >= 20
+    # A 1ms interval is shorter than the spin window, so high precision mode
+    # only yields to the loop and never arms a timer; otherwise every wait does
+    if high_precision:
+        assert timer_sleeps == []
+    else:
+        assert timer_sleeps
+    # Deadlines are absolute, so ticks never run ahead of the configured rate
+    interval = 1.0 / tm.tick_rate
+    for index, tick_time in enumerate(tick_times):
+        assert tick_time - tick_times[0] >= (index - 1) * interval
+
+@pytest.mark.asyncio
+async def test_tick_manager_timer_thread(monkeypatch):
+    import threading
+    
+    loop = asyncio.get_running_loop()
+    wake_threads = []
+    real_call_soon_threadsafe = loop.call_soon_threadsafe
+    
+    def recording_call_soon_threadsafe(callback, *args, **kwargs):
+        wake_threads.append(threading.current_thread())
+        return real_call_soon_threadsafe(callback, *args, **kwargs)
+    
+    monkeypatch.setattr(loop, "call_soon_threadsafe", recording_call_soon_threadsafe)
+    
+    tm = TickManager(tick_rate=100.0, timer_thread=True)
+    tm.set_root_node(DummyNode(name='root'))
+    
+    await tm.start()
+    for _ in range(500):
+        if tm.get_tick_count() >= 3:
+            break
+        await asyncio.sleep(0.01)
+    await tm.stop()
+    
+    # Every wake-up was handed over from the timer thread
+    assert tm.get_tick_count() >= 3
+    assert wake_threads
+    assert threading.main_thread() not in wake_threads
+    ticks = tm.get_tick_count()
+    await asyncio.sleep(0.05)
+    assert tm.get_tick_count() == ticks
+
+@pytest.mark.asyncio
+async def test_threaded_tick_driver_coalesces_wake_ups():
+    from abtree.engine._tick_driver import ThreadedTickDriver
+    
+    # Not started, so only the wake-ups delivered here exist
+    driver = ThreadedTickDriver(asyncio.get_running_loop(), 1.0)
+    driver._signal()
+    driver._signal()
+    
+    # Two wake-ups that arrived while nobody waited count as one
+    await asyncio.wait_for(driver.wait(), timeout=1.0)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(driver.wait(), timeout=0.01)
+    
+    # A wake-up delivered to a waiter resolves it
+    waiting = asyncio.ensure_future(driver.wait())
+    await asyncio.sleep(0)
+    driver._signal()
+    await asyncio.wait_for(waiting, timeout=1.0)
+
+@pytest.mark.asyncio
+async def test_tick_scheduler_drives_multiple_managers():
+    scheduler = TickScheduler()
+    fast = TickManager(tick_rate=100.0, scheduler=scheduler)
+    slow = TickManager(tick_rate=20.0, scheduler=scheduler)
+    fast.set_root_node(DummyNode(name='fast'))
+    slow.set_root_node(DummyNode(name='slow'))
+    
+    await fast.start()
+    await slow.start()
+    assert fast._task is None and slow._task is None
+    assert scheduler.get_manager_count() == 2
+    
+    await asyncio.sleep(0.3)
+    await slow.stop()
+    assert not scheduler.is_registered(slow)
+    slow_ticks = slow.get_tick_count()
+    
+    await asyncio.sleep(0.05)
+    await fast.stop()
+    await scheduler.close()
+    
+    assert slow.get_tick_count() == slow_ticks
+    assert 3 <= slow_ticks <= 9
+    assert fast.get_tick_count() > slow_ticks
+
+class SlowNode(BaseNode):
+    async def tick(self):
+        await asyncio.sleep(0.05)
+        return Status.SUCCESS
+
+@pytest.mark.asyncio
+async def test_tick_scheduler_restart_during_tick():
+    scheduler = TickScheduler()
+    tm = TickManager(tick_rate=100.0, scheduler=scheduler)
+    tm.set_root_node(SlowNode(name='root'))
+    
+    await tm.start()
+    await asyncio.sleep(0.01)
+    slot = scheduler._slots[id(tm)]
+    first_tick = scheduler._running[slot]
+    assert first_tick is not None
+    
+    # Restarting mid-tick cancels the old tick and schedules the slot once
+    await tm.stop()
+    await tm.start()
+    await asyncio.sleep(0)
+    assert first_tick.cancelled()
+    slot = scheduler._slots[id(tm)]
+    generation = scheduler._generations[slot]
+    pending = [entry for entry in scheduler._heap if entry[1] == slot and entry[2] == generation]
+    in_flight = [task for task in scheduler._running if task is not None]
+    assert len(pending) + len(in_flight) == 1
+    
+    await tm.stop()
+    await scheduler.close()
+
+@pytest.mark.asyncio
+async def test_tick_scheduler_follows_tick_rate_changes():
+    scheduler = TickScheduler()
+    tm = TickManager(tick_rate=1.0, scheduler=scheduler)
+    tm.set_root_node(DummyNode(name='root'))
+    
+    await tm.start()
+    for _ in range(100):
+        if tm.get_tick_count() == 1 and scheduler._running[scheduler._slots[id(tm)]] is None:
+            break
+        await asyncio.sleep(0)
+    assert tm.get_tick_count() == 1
+    
+    slot = scheduler._slots[id(tm)]
+    old_deadline = scheduler._deadlines[slot]
+    version = tm._config_version
+    
+    # The pending deadline moves to the new rate instead of waiting out the old one
+    tm.set_tick_rate(100.0)
+    assert tm._config_version == version + 1
+    pending = [
+        deadline for deadline, entry_slot, generation in scheduler._heap
+        if entry_slot == slot and generation == scheduler._generations[slot]
+    ]
+    assert pending == [pytest.approx(old_deadline - 1.0 + 0.01)]
+    assert scheduler._deadlines[slot] == pending[0]
+    
+    await tm.stop()
+    await scheduler.close()
+
 def test_behavior_tree_context_manager():
     async def test_context():
         async with BehaviorTree() as tree:
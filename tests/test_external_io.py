@@ -11,6 +11,8 @@ Tests for the new ExternalIO communication pattern including:
 
 import pytest
 import asyncio
+import logging
+from collections.abc import Sequence
 from unittest.mock import Mock, AsyncMock
 
 from abtree.forest.communication import CommunicationMiddleware
@@ -57,7 +59,7 @@ class TestExternalIO:
         middleware.register_input_handler("test_channel", handler)
         
         assert "test_channel" in middleware.external_input_handlers
-        assert handler in middleware.external_input_handlers["test_channel"]
+        assert handler in [h for h, _ in middleware.external_input_handlers["test_channel"]]
     
     def test_register_output_handler(self, middleware):
         """Test registering output handler"""
@@ -65,7 +67,7 @@ class TestExternalIO:
         middleware.register_output_handler("test_channel", handler)
         
         assert "test_channel" in middleware.external_output_handlers
-        assert handler in middleware.external_output_handlers["test_channel"]
+        assert handler in [h for h, _ in middleware.external_output_handlers["test_channel"]]
     
     def test_unregister_input_handler(self, middleware):
         """Test unregistering input handler"""
@@ -74,7 +76,7 @@ class TestExternalIO:
         
         result = middleware.unregister_input_handler("test_channel", handler)
         assert result is True
-        assert handler not in middleware.external_input_handlers["test_channel"]
+        assert handler not in [h for h, _ in middleware.external_input_handlers["test_channel"]]
     
     def test_unregister_output_handler(self, middleware):
         """Test unregistering output handler"""
@@ -83,7 +85,7 @@ class TestExternalIO:
         
         result = middleware.unregister_output_handler("test_channel", handler)
         assert result is True
-        assert handler not in middleware.external_output_handlers["test_channel"]
+        assert handler not in [h for h, _ in middleware.external_output_handlers["test_channel"]]
     
     @pytest.mark.asyncio
     async def test_input_processing(self, middleware, mock_input_handler):
@@ -137,7 +139,24 @@ class TestExternalIO:
         assert stats["output_queue_size"] == 1
         assert "input_channel" in stats["input_channels"]
         assert "output_channel" in stats["output_channels"]
-    
+
+    def test_get_external_io_stats_after_unregister(self, middleware):
+        """Test that unregistered handlers no longer count as channels"""
+        input_handler = Mock()
+        output_handler = Mock()
+        middleware.register_input_handler("input_channel", input_handler)
+        middleware.register_output_handler("output_channel", output_handler)
+
+        assert middleware.unregister_input_handler("input_channel", input_handler)
+        assert middleware.unregister_output_handler("output_channel", output_handler)
+
+        stats = middleware.get_external_io_stats()
+
+        assert stats["input_handlers"] == 0
+        assert stats["output_handlers"] == 0
+        assert stats["input_channels"] == []
+        assert stats["output_channels"] == []
+
     def test_clear_queues(self, middleware):
         """Test clearing input and output queues"""
         # Add some data to queues
@@ -245,6 +264,40 @@ class TestExternalIO:
         else:
             assert False, "No middleware found with input data"
     
+    @pytest.mark.asyncio
+    async def test_external_input_events_coalesced(self, forest):
+        """Test inputs from one loop iteration reach the forest dispatcher in one emit_many"""
+        middleware = CommunicationMiddleware("Coalesced")
+        middleware.initialize(forest)
+        dispatcher = forest.forest_event_dispatcher
+        emit_many = AsyncMock(wraps=dispatcher.emit_many)
+        dispatcher.emit_many = emit_many
+        
+        await asyncio.gather(*[middleware.external_input("sensor", i) for i in range(3)])
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        
+        emit_many.assert_awaited_once()
+        info = dispatcher.get_event_info("external_input_sensor")
+        assert info.data == 2
+        assert info.trigger_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_external_input_event_overlaps_handlers(self, forest):
+        """Test the forest event fires while a slow input handler is still running"""
+        middleware = CommunicationMiddleware("Overlap")
+        middleware.initialize(forest)
+        dispatcher = forest.forest_event_dispatcher
+        seen_by_handler = []
+        
+        async def slow_handler(info):
+            await asyncio.sleep(0.01)
+            seen_by_handler.append(dispatcher.is_event_set("external_input_sensor"))
+        
+        middleware.register_input_handler("sensor", slow_handler)
+        await middleware.external_input("sensor", 1)
+        assert seen_by_handler == [True]
+    
     @pytest.mark.asyncio
     async def test_external_output_node(self, forest):
         """Test CommExternalOutput node - simplified test"""
@@ -328,6 +381,135 @@ class TestExternalIO:
         # Verify error was logged (implementation dependent)
         # This test ensures the system doesn't crash on handler errors
 
+    
+    @pytest.mark.asyncio
+    async def test_handler_dispatch(self, middleware):
+        """Test lone and multiple handlers run, and handler errors are contained"""
+        async_handler = AsyncMock()
+        middleware.register_input_handler("input_channel", async_handler)
+        await middleware.external_input("input_channel", 1)
+        async_handler.assert_awaited_once()
+        
+        failing_handler = Mock(side_effect=RuntimeError("boom"))
+        second_handler = Mock()
+        middleware.register_output_handler("output_channel", failing_handler)
+        middleware.register_output_handler("output_channel", second_handler)
+        await middleware.external_output("output_channel", 2)
+        failing_handler.assert_called_once()
+        second_handler.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_async_queues(self):
+        """Test awaitable IO queues deliver items and drop the oldest when full"""
+        middleware = CommunicationMiddleware("AsyncQueues", async_queues=True)
+        consumer = asyncio.create_task(middleware.input_queue.get())
+        
+        await middleware.external_input("channel", {"value": 1})
+        item = await asyncio.wait_for(consumer, timeout=1.0)
+        assert item["data"] == {"value": 1}
+        
+        for i in range(middleware.max_io_queue_size + 2):
+            await middleware.external_output("channel", i)
+        assert len(middleware.output_queue) == middleware.max_io_queue_size
+        assert middleware.get_output_queue()[0]["data"] == 2
+        assert len(middleware.get_output_queue("channel")) == middleware.max_io_queue_size
+        
+        queue = middleware.get_output_queue()
+        assert isinstance(queue, Sequence)
+        assert [entry["data"] for entry in queue[-2:]] == [middleware.max_io_queue_size, middleware.max_io_queue_size + 1]
+        assert queue[-1] in queue
+        
+        middleware.clear_output_queue()
+        assert len(middleware.output_queue) == 0
+    
+    @pytest.mark.asyncio
+    async def test_filtered_queues(self, middleware):
+        """Test per-channel queue reads keep order and are reset by clear"""
+        for i in range(4):
+            await middleware.external_input("a" if i % 2 else "b", i)
+            await middleware.external_output("a" if i % 2 else "b", i)
+            await middleware.subscribe_external("a" if i % 2 else "b", i)
+        
+        assert [entry["data"] for entry in middleware.get_input_queue("a")] == [1, 3]
+        assert [entry["data"] for entry in middleware.get_output_queue("b")] == [0, 2]
+        assert [entry["data"] for entry in middleware.get_incoming_queue("a")] == [1, 3]
+        assert middleware.get_input_queue("missing") == []
+        
+        middleware.clear_input_queue()
+        middleware.clear_output_queue()
+        middleware.clear_incoming_queue()
+        assert middleware.get_input_queue("a") == []
+        assert middleware.get_output_queue("b") == []
+        assert middleware.get_incoming_queue("a") == []
+    
+    @pytest.mark.asyncio
+    async def test_disabled_input_logged(self, middleware, caplog):
+        """Test disabled middleware logs a warning instead of processing input"""
+        middleware.enabled = False
+        with caplog.at_level(logging.WARNING, logger="abtree.forest.communication"):
+            await middleware.external_input("test_channel", {"large": "payload"})
+        
+        assert len(middleware.input_queue) == 0
+        assert "test_channel" in caplog.text
+        assert "payload" not in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_deferred_handlers(self):
+        """Test deferred handlers run in order on a consumer task and flush waits for them"""
+        middleware = CommunicationMiddleware("Deferred", deferred_handlers=True)
+        received = []
+        middleware.register_input_handler("channel", lambda info: received.append(info["data"]))
+        
+        for i in range(5):
+            await middleware.external_input("channel", i)
+        assert received == []
+        assert len(middleware.get_input_queue("channel")) == 5
+        
+        await middleware.flush()
+        assert received == [0, 1, 2, 3, 4]
+        
+        await middleware.close()
+        assert middleware._handler_consumers == []
+    
+    @pytest.mark.asyncio
+    async def test_close_cancels_background_tasks(self):
+        """Test close cancels the flush timer and drops buffered events"""
+        middleware = CommunicationMiddleware("Batched", batch_window_us=60_000_000)
+        callback = Mock()
+        middleware.subscribe("topic", callback)
+        await middleware.publish("topic", 1, "source")
+        flush_task = middleware._flush_task
+        assert flush_task is not None
+        
+        await middleware.close()
+        assert flush_task.cancelled()
+        assert middleware._flush_task is None
+        assert middleware._publish_buffer == []
+        callback.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_close_cancels_every_forest_emit_task(self):
+        """Test close cancels forest emits from every loop iteration, not just the last"""
+        middleware = CommunicationMiddleware("Emits")
+        blocked = asyncio.Event()
+        
+        async def emit_many(events, source=None):
+            await blocked.wait()
+        
+        middleware.forest = Mock()
+        middleware.forest.forest_event_dispatcher.emit_many = emit_many
+        
+        for i in range(2):
+            middleware._pending_forest_emits.append((f"external_input_{i}", i))
+            middleware._schedule_forest_emits()
+            await asyncio.sleep(0)
+        emit_tasks = set(middleware._forest_emit_tasks)
+        assert len(emit_tasks) == 2
+        
+        await middleware.close()
+        assert all(task.cancelled() for task in emit_tasks)
+        assert not middleware._forest_emit_tasks
+
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -13,6 +13,7 @@ from abtree.forest.communication import (
 )
 from abtree.engine.behavior_tree import BehaviorTree
 from abtree.core.status import Status
+from abtree.nodes.base import BaseNode
 
 class DummyTree(BehaviorTree):
     def __init__(self, name: str = "DummyTree"):
@@ -103,6 +104,77 @@ async def test_behavior_forest_start_stop():
     
     assert not forest.running
 
+@pytest.mark.asyncio
+async def test_behavior_forest_stop_closes_sync_and_async_middleware():
+    forest = BehaviorForest(name="f")
+    comm = forest.middleware[0]
+    comm._notify_task = asyncio.create_task(asyncio.sleep(60))
+
+    class SyncCloseMiddleware:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    plugin_middleware = SyncCloseMiddleware()
+    forest.add_middleware(plugin_middleware)
+    forest.running = True
+
+    await forest.stop()
+
+    assert plugin_middleware.closed
+    assert comm._notify_task is None
+    assert forest.forest_event_dispatcher.is_event_set("forest_stopped")
+
+@pytest.mark.asyncio
+async def test_behavior_forest_keeps_own_pacing_for_precise_trees():
+    forest = BehaviorForest(name="f")
+    shared = make_node("shared")
+    precise = make_node("precise")
+    forest.add_node(shared)
+    forest.add_node(precise)
+    precise.tree.tick_manager.high_precision = True
+
+    await asyncio.wait_for(forest.start(), timeout=5.0)
+    try:
+        assert shared.tree.tick_manager.scheduler is forest._tick_scheduler
+        assert precise.tree.tick_manager.scheduler is None
+    finally:
+        await asyncio.wait_for(forest.stop(), timeout=5.0)
+
+class SleepingNode(BaseNode):
+    def __init__(self, name: str, delay: float):
+        super().__init__(name=name)
+        self.delay = delay
+
+    async def tick(self):
+        await asyncio.sleep(self.delay)
+        return Status.SUCCESS
+
+@pytest.mark.asyncio
+async def test_behavior_forest_slow_tree_does_not_stall_fast_tree():
+    forest = BehaviorForest(name="f")
+    fast = make_node("fast")
+    slow = make_node("slow")
+    forest.add_node(fast)
+    forest.add_node(slow)
+    fast.tree.tick_manager.set_tick_rate(60.0)
+    fast.tree.tick_manager.set_root_node(SleepingNode("fast_root", 0.0))
+    slow.tree.tick_manager.set_root_node(SleepingNode("slow_root", 0.5))
+
+    await asyncio.wait_for(forest.start(), timeout=5.0)
+    try:
+        assert fast.tree.tick_manager.scheduler is forest._tick_scheduler
+        assert slow.tree.tick_manager.scheduler is forest._tick_scheduler
+        await asyncio.sleep(0.6)
+    finally:
+        await asyncio.wait_for(forest.stop(), timeout=5.0)
+
+    # A blocking batch would hold the fast tree to about one tick per slow
+    # tick; lower bound left loose for loaded CI machines
+    assert slow.tree.tick_manager.get_tick_count() <= 2
+    assert fast.tree.tick_manager.get_tick_count() >= 10
+
 def test_forest_manager_basic():
     manager = ForestManager(name="test_manager")
     assert manager.name == "test_manager"
@@ -1,12 +1,18 @@
+import logging
+import sys
+import threading
+
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock
 from abtree.forest.communication import (
-    CommunicationMiddleware, CommunicationType, Message, Request, Response, Task,
+    CommunicationMiddleware, CommunicationType, Message, Request, Response, Task, TopicEvent, ChannelEvent,
+    AccessLogEntry, StateHistoryEntry, CallLogEntry,
     Message, Request, Response, Task
 )
 from abtree.forest.core import BehaviorForest, ForestNode, ForestNodeType
 from abtree.engine.behavior_tree import BehaviorTree
+from abtree.engine.blackboard import Blackboard
 from abtree.core.status import Status
 
 
@@ -67,7 +73,141 @@ class TestCommunicationMiddleware:
         call_args = mock_callback.call_args[0][0]
         assert call_args["topic"] == "test_topic"
         assert call_args["data"] == {"data": "test"}
-    
+
+    @pytest.mark.asyncio
+    async def test_pubsub_publish_single_subscriber(self, middleware, caplog):
+        """Test a lone subscriber is awaited and its errors are contained"""
+        async_callback = AsyncMock()
+        middleware.subscribe("async_topic", async_callback)
+        await middleware.publish("async_topic", 1, "source")
+        async_callback.assert_awaited_once()
+
+        failing_callback = Mock(side_effect=RuntimeError("boom"))
+        middleware.subscribe("failing_topic", failing_callback)
+        with caplog.at_level(logging.ERROR, logger="abtree.forest.communication"):
+            await middleware.publish("failing_topic", 2, "source")
+        failing_callback.assert_called_once()
+        assert "PubSub callback error" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_pubsub_publish_multiple_subscribers(self, middleware, caplog):
+        """Test every subscriber runs when several are registered and errors are logged"""
+        sync_callback = Mock()
+        async_callback = AsyncMock()
+        failing_callback = AsyncMock(side_effect=RuntimeError("boom"))
+        middleware.subscribe("test_topic", sync_callback)
+        middleware.subscribe("test_topic", async_callback)
+        middleware.subscribe("test_topic", failing_callback)
+
+        with caplog.at_level(logging.ERROR, logger="abtree.forest.communication"):
+            await middleware.publish("test_topic", 1, "source")
+
+        sync_callback.assert_called_once()
+        async_callback.assert_awaited_once()
+        failing_callback.assert_awaited_once()
+        assert "PubSub callback error" in caplog.text
+        assert "boom" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_record_logs_disabled(self, mock_callback):
+        """Test disabling logs keeps data and notifications but records nothing"""
+        middleware = CommunicationMiddleware("Unlogged", record_logs=False)
+        middleware.set("key", 1, "writer")
+        assert middleware.get("key", source="reader") == 1
+        middleware.watch_state("state", mock_callback, "source")
+        await middleware.update_state("state", 2, "source")
+        middleware.register_behavior("behavior", lambda params: 3)
+        assert await middleware.call_behavior("behavior", {}, "source") == 3
+
+        mock_callback.assert_called_once_with("state", None, 2, "source")
+        assert middleware.get_state("state") == 2
+        assert middleware.get_access_log() == ()
+        assert middleware.get_state_history("state") == ()
+        assert middleware.get_call_log() == ()
+
+    def test_log_reads_disabled(self):
+        """Test turning off read logging keeps writes and removals in the access log"""
+        middleware = CommunicationMiddleware("WritesOnly", log_reads=False)
+        middleware.set("key", 1, "writer")
+        assert middleware.get("key", source="reader") == 1
+        middleware.remove("key", "writer")
+
+        assert [entry.operation for entry in middleware.get_access_log()] == ["set", "remove"]
+
+    @pytest.mark.asyncio
+    async def test_pubsub_batched_publish(self):
+        """Test micro-batched publishing delivers events when the window closes"""
+        middleware = CommunicationMiddleware("Batched", batch_window_us=1000)
+        received = []
+        middleware.subscribe("test_topic", lambda event_info: received.append(event_info["data"]))
+
+        await middleware.publish("test_topic", 1, "source")
+        await middleware.publish("test_topic", 2, "source")
+        assert received == []
+        assert len(middleware.get_event_history()) == 2
+
+        await asyncio.sleep(0.05)
+        assert received == [1, 2]
+
+        await middleware.publish("test_topic", 3, "source")
+        await middleware.flush()
+        assert received == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_pubsub_callback_unsubscribes_itself(self, middleware):
+        """Test a callback can unsubscribe while the event is being dispatched"""
+        calls = []
+
+        def once(event_info):
+            calls.append("once")
+            middleware.unsubscribe("test_topic", once)
+
+        def always(event_info):
+            calls.append("always")
+
+        middleware.subscribe("test_topic", once)
+        middleware.subscribe("test_topic", always)
+
+        await middleware.publish("test_topic", 1, "source")
+        await middleware.publish("test_topic", 2, "source")
+
+        assert calls == ["once", "always", "always"]
+
+    @pytest.mark.asyncio
+    async def test_bound_publisher(self, middleware, mock_callback):
+        """Test a bound publisher matches publish and sees later subscribers"""
+        publish_sensor = middleware.bind_publisher("sensor", "node")
+        stats = middleware.get_external_communication_stats()
+        assert stats["out_publishers"] == 0
+        assert stats["publisher_topics"] == []
+        middleware.subscribe("sensor", mock_callback)
+
+        await publish_sensor(42)
+        mock_callback.assert_called_once()
+        event_info = mock_callback.call_args[0][0]
+        assert (event_info.topic, event_info.data, event_info.source) == ("sensor", 42, "node")
+        assert middleware.get_event_history("sensor") == (event_info,)
+
+        middleware.enabled = False
+        await publish_sensor(43)
+        assert mock_callback.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_bound_state_setter(self, middleware, mock_callback):
+        """Test a bound state setter matches update_state"""
+        set_speed = middleware.bind_state_setter("speed", "node")
+        middleware.watch_state("speed", mock_callback, "watcher")
+
+        await set_speed(1)
+        await set_speed(1)
+        await set_speed(2)
+
+        assert middleware.get_state("speed") == 2
+        assert [call.args for call in mock_callback.call_args_list] == [
+            ("speed", None, 1, "node"), ("speed", 1, 2, "node")
+        ]
+        assert len(middleware.get_state_history("speed")) == 2
+
     def test_reqresp_register_unregister_service(self, middleware):
         """Test request-response service registration"""
         def test_handler(params):
@@ -125,7 +265,66 @@ class TestCommunicationMiddleware:
         
         log = middleware.get_access_log()
         assert len(log) >= 2  # At least one set and one get operation
-    
+
+    @pytest.mark.asyncio
+    async def test_filtered_histories_and_logs(self, middleware):
+        """Test history and log filters by topic, source and behavior"""
+        await middleware.publish("a", 1, "source")
+        await middleware.publish("b", 2, "source")
+        await middleware.publish("a", 3, "source")
+        assert [event["data"] for event in middleware.get_event_history("a")] == [1, 3]
+        assert len(middleware.get_event_history("missing")) == 0
+
+        middleware.set("key", 1, "writer")
+        middleware.get("key", source="reader")
+        assert [entry["operation"] for entry in middleware.get_access_log("writer")] == ["set"]
+        assert [entry["operation"] for entry in middleware.get_access_log("reader")] == ["get"]
+
+        middleware.register_behavior("first", lambda params: 1)
+        middleware.register_behavior("second", lambda params: 2)
+        await middleware.call_behavior("first", {}, "source")
+        await middleware.call_behavior("second", {}, "source")
+        assert [entry["result"] for entry in middleware.get_call_log("second")] == [2]
+
+        def failing_behavior(params):
+            raise RuntimeError("boom")
+
+        middleware.register_behavior("failing", failing_behavior)
+        with pytest.raises(RuntimeError):
+            await middleware.call_behavior("failing", {}, "source")
+        entry = middleware.get_call_log("failing")[0]
+        assert isinstance(entry, CallLogEntry)
+        assert (entry.success, entry.error, entry.result) == (False, "boom", None)
+
+    @pytest.mark.asyncio
+    async def test_history_getters_return_snapshots(self, middleware):
+        """Test history getters return immutable snapshots"""
+        await middleware.publish("topic", 1, "source")
+        history = middleware.get_event_history()
+        await middleware.publish("topic", 2, "source")
+
+        assert isinstance(history, tuple)
+        assert len(history) == 1
+        assert len(middleware.get_event_history()) == 2
+        assert isinstance(middleware.get_subscribers("topic"), tuple)
+
+    def test_history_buffers_are_bounded(self, middleware):
+        """Test that histories and logs keep only the most recent entries"""
+        for i in range(middleware.max_log_size + 5):
+            middleware.set("key", i, "source")
+
+        log = middleware.get_access_log()
+        assert len(log) == middleware.max_log_size
+        assert log[0]["value"] == 5
+        assert log[-1]["value"] == middleware.max_log_size + 4
+
+        for i in range(middleware.max_history_per_key + 3):
+            asyncio.run(middleware.update_state("key", i, "source"))
+
+        history = middleware.get_state_history("key")
+        assert len(history) == middleware.max_history_per_key
+        assert history[0]["new_value"] == 3
+
     def test_state_watching(self, middleware, mock_callback):
         """Test state monitoring functionality"""
         # Monitor state changes
@@ -137,13 +336,42 @@ class TestCommunicationMiddleware:
         # Verify callback was called
         mock_callback.assert_called_once()
     
+    def test_state_update_with_same_value_is_skipped(self, middleware, mock_callback):
+        """Test writing an unchanged value records nothing and notifies nobody"""
+        middleware.watch_state("test_key", mock_callback, "source")
+
+        asyncio.run(middleware.update_state("test_key", "value", "source"))
+        asyncio.run(middleware.update_state("test_key", "value", "source"))
+
+        mock_callback.assert_called_once_with("test_key", None, "value", "source")
+        assert len(middleware.get_state_history("test_key")) == 1
+
+    @pytest.mark.asyncio
+    async def test_state_first_write_of_none_is_skipped(self, middleware, mock_callback):
+        """Test a new key written as None counts as unchanged, like reading it before"""
+        middleware.watch_state("direct", mock_callback, "source")
+        middleware.watch_state("bound", mock_callback, "source")
+
+        await middleware.update_state("direct", None, "source")
+        await middleware.bind_state_setter("bound", "source")(None)
+
+        mock_callback.assert_not_called()
+        assert middleware.get_state_history("direct") == ()
+        assert middleware.get_state_history("bound") == ()
+        assert "direct" in middleware.state_cache
+
+        await middleware.update_state("direct", 1, "source")
+        mock_callback.assert_called_once_with("direct", None, 1, "source")
+
     def test_state_watching_unwatch(self, middleware, mock_callback):
         """Test unwatch state monitoring"""
         middleware.watch_state("test_key", mock_callback, "source")
+        assert middleware.get_watched_keys() == ["test_key"]
         
         # Unwatch state
         result = middleware.unwatch_state("test_key", mock_callback)
         assert result is True
+        assert middleware.get_watched_keys() == []
     
     def test_behavior_call_register_unregister(self, middleware):
         """Test behavior call registration"""
@@ -172,7 +400,31 @@ class TestCommunicationMiddleware:
         # Call behavior
         result = await middleware.call_behavior("test_behavior", {"param": "value"}, "source")
         assert result == Status.SUCCESS
-    
+
+    @pytest.mark.asyncio
+    async def test_async_service_and_behavior(self, middleware):
+        """Test coroutine services and behaviors are awaited"""
+        async def service(params, source):
+            return params["value"] * 2
+
+        async def behavior(params):
+            return Status.RUNNING
+
+        middleware.register_service("double", service)
+        middleware.register_behavior("async_behavior", behavior)
+
+        assert await middleware.request("double", {"value": 21}, "source") == 42
+        assert await middleware.call_behavior("async_behavior", {}, "source") == Status.RUNNING
+        with pytest.raises(ValueError):
+            await middleware.request("missing", {}, "source")
+
+    def test_unsubscribe_unknown_callback(self, middleware, mock_callback):
+        """Test unsubscribing a callback that was never registered"""
+        assert middleware.unsubscribe("test_topic", mock_callback) is False
+        middleware.subscribe("test_topic", mock_callback)
+        assert middleware.unsubscribe("test_topic", Mock()) is False
+        assert middleware.unwatch_state("test_key", mock_callback) is False
+
     def test_task_board_publish_task(self, middleware):
         """Test task board publish task"""
         task_id = middleware.publish_task(
@@ -186,6 +438,29 @@ class TestCommunicationMiddleware:
         # Get available tasks
         available_tasks = middleware.get_available_tasks({"capability1", "capability2"})
         assert len(available_tasks) >= 1
+
+    def test_task_board_requirements_are_frozen(self, middleware):
+        """Test requirements are stored immutably and capabilities may be any iterable"""
+        requirements = {"cap1"}
+        task_id = middleware.publish_task("Task", "Description", requirements)
+        requirements.add("cap2")
+
+        task = middleware.tasks[task_id]
+        assert task.requirements == frozenset({"cap1"})
+        assert middleware.get_available_tasks(["cap1"]) == [task]
+        assert middleware.claim_task(task_id, "worker", ["cap1"]) is True
+
+    def test_task_board_shared_requirement_sets(self, middleware):
+        """Test equal requirement sets share one object and filtering keeps priority order"""
+        low = middleware.publish_task("Low", "Description", {"cap1", "cap2"}, priority=1)
+        other = middleware.publish_task("Other", "Description", {"cap3"}, priority=5)
+        high = middleware.publish_task("High", "Description", ["cap2", "cap1"], priority=9)
+
+        tasks = middleware.tasks
+        assert tasks[low].requirements is tasks[high].requirements
+        available = middleware.get_available_tasks({"cap1", "cap2"})
+        assert available == [tasks[high], tasks[low]]
+        assert tasks[other] not in available
     
     def test_task_board_claim_task(self, middleware):
         """Test task board claim task"""
@@ -242,7 +517,131 @@ class TestCommunicationMiddleware:
         assert "claimed_tasks" in stats
         assert "completed_tasks" in stats
         assert "failed_tasks" in stats
-    
+
+    def test_task_board_available_and_claimed_tasks(self, middleware):
+        """Test available tasks are ordered by priority and claimed tasks are tracked"""
+        low = middleware.publish_task("Low", "Low priority", {"cap1"}, priority=1)
+        high = middleware.publish_task("High", "High priority", {"cap1"}, priority=5)
+        middleware.publish_task("Other", "Needs cap2", {"cap2"}, priority=9)
+        same = middleware.publish_task("Same", "Same priority", {"cap1"}, priority=1)
+
+        available = middleware.get_available_tasks({"cap1"})
+        assert [task.id for task in available] == [high, low, same]
+
+        middleware.claim_task(high, "worker", {"cap1"})
+        middleware.claim_task(low, "worker", {"cap1"})
+        assert [task.id for task in middleware.get_available_tasks({"cap1"})] == [same]
+        assert [task.id for task in middleware.get_claimed_tasks("worker")] == [high, low]
+        top = middleware.publish_task("Top", "Published later", {"cap1"}, priority=9)
+        assert [task.id for task in middleware.get_available_tasks({"cap1"})] == [top, same]
+
+        middleware.complete_task(high)
+        middleware.fail_task(low, "error")
+        assert middleware.get_claimed_tasks("worker") == []
+
+    def test_task_board_claim_is_exclusive(self, middleware):
+        """Test concurrent claimants cannot both win the same task"""
+        task_id = middleware.publish_task("Task", "Contested", {"cap1"})
+        results = {}
+
+        def claim(name):
+            results[name] = middleware.claim_task(task_id, name, {"cap1"})
+
+        threads = [threading.Thread(target=claim, args=(f"worker_{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        winners = [name for name, won in results.items() if won]
+        assert len(winners) == 1
+        assert middleware.tasks[task_id].claimed_by == winners[0]
+
+    @pytest.mark.asyncio
+    async def test_task_board_callbacks(self, middleware):
+        """Test claim callbacks fire for the event they were registered for"""
+        claimed = Mock()
+        completed = AsyncMock()
+        middleware.register_claim_callback(claimed)
+        middleware.register_claim_callback(completed, event="task_completed")
+
+        task_id = middleware.publish_task("Task", "Description", {"cap1"})
+        middleware.claim_task(task_id, "worker", {"cap1"})
+        middleware.complete_task(task_id, "done")
+        await asyncio.sleep(0)
+
+        claimed.assert_called_once_with(middleware.tasks[task_id])
+        completed.assert_awaited_once_with(middleware.tasks[task_id])
+        with pytest.raises(ValueError):
+            middleware.register_claim_callback(claimed, event="unknown")
+
+    @pytest.mark.asyncio
+    async def test_task_callbacks_async_errors_logged(self, middleware, caplog):
+        """Test several async task callbacks all run and their errors are logged"""
+        first = AsyncMock()
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        middleware.register_claim_callback(first, event="task_available")
+        middleware.register_claim_callback(failing, event="task_available")
+
+        with caplog.at_level(logging.ERROR, logger="abtree.forest.communication"):
+            task_id = middleware.publish_task("Task", "Description", {"cap1"})
+            assert middleware._notify_task is not None
+            await middleware._notify_task
+
+        first.assert_awaited_once_with(middleware.tasks[task_id])
+        failing.assert_awaited_once()
+        assert "Task task_available callback error" in caplog.text
+        assert middleware._notify_task is None
+
+    @pytest.mark.asyncio
+    async def test_task_callbacks_async_batched_in_order(self, middleware):
+        """Test async task callbacks from one tick share a task and run in order"""
+        seen = []
+        events = ("task_available", "task_claimed", "task_completed")
+
+        def recorder(event):
+            async def record(task):
+                seen.append(event)
+            return record
+
+        for event in events:
+            middleware.register_claim_callback(recorder(event), event=event)
+
+        task_id = middleware.publish_task("Task", "Description", {"cap1"})
+        notify_task = middleware._notify_task
+        middleware.claim_task(task_id, "worker", {"cap1"})
+        middleware.complete_task(task_id, "done")
+        assert middleware._notify_task is notify_task
+        assert len(middleware._pending_notifications) == 3
+
+        await middleware.flush()
+        assert seen == list(events)
+        assert middleware._notify_task is None
+        assert not middleware._pending_notifications
+
+    def test_task_board_stats_counts(self, middleware):
+        """Test task board statistics count each status"""
+        first = middleware.publish_task("Task 1", "Description 1", {"cap1"})
+        second = middleware.publish_task("Task 2", "Description 2", {"cap1"})
+        middleware.publish_task("Task 3", "Description 3", {"cap1"})
+        middleware.claim_task(first, "worker", {"cap1"})
+        middleware.fail_task(second, "error")
+
+        stats = middleware.get_task_stats()
+        assert stats == {
+            "total_tasks": 3,
+            "pending_tasks": 1,
+            "claimed_tasks": 1,
+            "completed_tasks": 0,
+            "failed_tasks": 1,
+        }
+
+        # Counts follow later transitions; invalid ones change nothing
+        middleware.complete_task(first, "done")
+        middleware.complete_task(second, "done")
+        stats = middleware.get_task_stats()
+        assert (stats["claimed_tasks"], stats["completed_tasks"], stats["failed_tasks"]) == (0, 1, 1)
+
     def test_shared_event_dispatcher_integration(self, middleware, forest):
         """Test shared event dispatcher integration"""
         middleware.initialize(forest)
@@ -255,9 +654,51 @@ class TestCommunicationMiddleware:
         trees = middleware.get_trees_with_shared_event_dispatcher()
         assert "test_tree" in trees
         
+        assert "test_tree" in middleware.get_shared_event_dispatcher_stats()["tree_names"]
+        # An empty blackboard still receives the shared dispatcher
+        empty_tree = BehaviorTree(name="empty_tree")
+        empty_tree.blackboard = Blackboard()
+        middleware.add_tree_to_shared_event_dispatcher("empty_tree", empty_tree)
+        assert empty_tree.blackboard.get("__event_dispatcher") is middleware.shared_event_dispatcher
+        
         # Remove tree from shared event dispatcher
         result = middleware.remove_tree_from_shared_event_dispatcher("test_tree")
         assert result is True
+        assert middleware.remove_tree_from_shared_event_dispatcher("test_tree") is False
+        assert "test_tree" not in middleware.get_trees_with_shared_event_dispatcher()
+    
+    @pytest.mark.asyncio
+    async def test_external_publishers_and_subscribers(self, middleware):
+        """Test external publisher/subscriber registration, dispatch and getters"""
+        publisher = Mock()
+        subscriber = AsyncMock()
+        middleware.register_publisher("out", publisher)
+        middleware.register_subscriber("in", subscriber)
+        
+        assert middleware.get_out_publishers("out") == (publisher,)
+        assert middleware.get_in_subscribers("in") == (subscriber,)
+        assert middleware.get_out_publishers("unknown") == ()
+        
+        await middleware.publish_to_external("out", 1, "source")
+        await middleware.subscribe_external("in", 2)
+        assert publisher.call_args[0][0].data == 1
+        assert subscriber.await_args[0][0].data == 2
+        
+        assert middleware.unregister_publisher("out", publisher) is True
+        assert middleware.unregister_publisher("out", publisher) is False
+        assert middleware.get_out_publishers("out") == ()
+    
+    def test_emit_shared_event_without_loop(self, middleware):
+        """Test shared events are triggered immediately from synchronous code"""
+        middleware.emit_shared_event("ready", source="tree1", data={"value": 1})
+        middleware.emit_shared_event("ready", source="tree2", data={"value": 2})
+        
+        dispatcher = middleware.shared_event_dispatcher
+        assert dispatcher.is_event_set("ready")
+        info = dispatcher.get_event_info("ready")
+        assert info.source == "tree2"
+        assert info.data == {"value": 2}
+        assert info.trigger_count == 2
     
     def test_shared_event_dispatcher_stats(self, middleware):
         """Test shared event dispatcher statistics"""
@@ -337,6 +778,51 @@ class TestCommunicationMiddleware:
         assert task.priority == 5
         assert task.status == "pending"
     
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_message_classes_use_slots(self):
+        """Test message and task instances carry no per-instance __dict__"""
+        request = Request(id="req", source="source")
+        task = Task(id="task", title="Title", description="Description")
+
+        assert not hasattr(request, "__dict__")
+        assert not hasattr(task, "__dict__")
+        assert not hasattr(TopicEvent("topic", None, "source", 0.0), "__dict__")
+        assert not hasattr(ChannelEvent("channel", None, "source", 0.0), "__dict__")
+        assert not hasattr(AccessLogEntry(0.0, "set", "key", None, "source"), "__dict__")
+        assert not hasattr(StateHistoryEntry(0.0, None, 1, "source"), "__dict__")
+        assert not hasattr(CallLogEntry(0.0, "behavior", {}, "source"), "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = 1
+    
+    @pytest.mark.asyncio
+    async def test_event_info_access(self, middleware):
+        """Test event infos support attribute and dict-style reads"""
+        received = []
+        middleware.subscribe("topic", received.append)
+        await middleware.publish("topic", {"value": 1}, "source")
+        
+        event = received[0]
+        assert isinstance(event, TopicEvent)
+        assert event.data is event["data"]
+        assert event.topic == "topic"
+        assert "timestamp" in event
+        assert "channel" not in event
+        assert event.get("channel", "none") == "none"
+        with pytest.raises(KeyError):
+            event["channel"]
+        assert event.as_dict() == {
+            "topic": "topic", "data": {"value": 1}, "source": "source", "timestamp": event.timestamp
+        }
+        assert dict(event) == {**event} == event.as_dict()
+        assert list(event.keys()) == ["topic", "data", "source", "timestamp"]
+        assert len(event) == 4
+
+        middleware.register_behavior("behavior", lambda params: "ok")
+        await middleware.call_behavior("behavior", {}, "source")
+        entry = middleware.get_call_log()[0]
+        assert dict(entry.items())["result"] == "ok"
+        assert set(entry) >= {"behavior", "params", "source", "success"}
+
     def test_communication_type_enum(self):
         """Test communication type enumeration"""
         assert CommunicationType.PUB_SUB == CommunicationType.PUB_SUB
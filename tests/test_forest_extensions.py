@@ -226,6 +226,39 @@ class TestExtensionErrorHandling:
         assert monitor_forest_performance is None
 
 
+class TestForestLazyImports:
+    """Test lazy re-exports of the forest package"""
+    
+    def test_advanced_features_resolve_on_access(self):
+        """Test advanced features are resolved through module __getattr__"""
+        import abtree.forest as forest_package
+        
+        assert isinstance(forest_package.PLUGIN_SYSTEM_AVAILABLE, bool)
+        if forest_package.PERFORMANCE_MONITORING_AVAILABLE:
+            assert forest_package.PerformanceMonitor is PerformanceMonitor
+        assert "PluginManager" in dir(forest_package)
+        
+        with pytest.raises(AttributeError):
+            forest_package.NotAForestFeature
+    
+    def test_import_does_not_load_advanced_features(self):
+        """Test importing the package and reading flags leaves optional modules unloaded"""
+        import subprocess
+        import sys
+        
+        code = (
+            "import sys, abtree.forest; "
+            "abtree.forest.PLUGIN_SYSTEM_AVAILABLE; "
+            "abtree.forest.PERFORMANCE_MONITORING_AVAILABLE; "
+            "print('abtree.forest.plugin_system' in sys.modules, "
+            "'abtree.forest.performance' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False False"
+
+
 class TestExtensionIntegration:
     """Test extension integration"""
     
@@ -275,4 +275,18 @@ def test_logger_with_custom_config():
         enable_colors=False
     )
     logger = get_logger("custom_logger", config=config)
-    assert logger.config.level == "DEBUG" 
\ No newline at end of file
+    assert logger.config.level == "DEBUG"
+
+
+def test_install_fast_event_loop():
+    import asyncio
+    from abtree.utils import fast_event_loop_available, install_fast_event_loop
+
+    policy = asyncio.get_event_loop_policy()
+    try:
+        installed = install_fast_event_loop()
+        assert installed == fast_event_loop_available()
+        if not installed:
+            assert asyncio.get_event_loop_policy() is policy
+    finally:
+        asyncio.set_event_loop_policy(policy)